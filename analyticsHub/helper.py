@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 from pathlib import Path
 import plotly.graph_objects as go
+from utils.io import read_last_row
 
 def _get_chosen_performance_df(all_df: pd.DataFrame, chosen_model_versions: list, chosen_model_label_types: list, chosed_model_windows: list) -> (list, list):
     """
@@ -22,8 +23,9 @@ def _get_chosen_performance_df(all_df: pd.DataFrame, chosen_model_versions: list
         all_df['window'].isin(chosed_model_windows)
     ), axis=0)
 
-    selected_model_identifier = all_df.loc[filter_bool, 'model_identifier'].values.tolist()
-    selected_performance_df = all_df.loc[filter_bool, 'performance_df'].values.tolist()
+    selected_df = all_df.loc[filter_bool, ['model_identifier', 'performance_df']]
+    selected_model_identifier = selected_df['model_identifier'].tolist()
+    selected_performance_df = selected_df['performance_df'].tolist()
     
     return selected_model_identifier, selected_performance_df
 
@@ -62,11 +64,10 @@ def _generate_score_data(rolling_window: str) -> (pd.DataFrame, str):
     score_paths = Path(f'data/stock/score/{rolling_window}').rglob('*.csv')
     all_ticker = [file.stem for file in Path(f'data/stock/score/{rolling_window}').rglob('*.csv')]
     
-    score_df = pd.DataFrame()
-    for ticker, file in zip(all_ticker, score_paths):
-        temp_score_df = pd.read_csv(file, usecols=['Date', f'Score {rolling_window}']).tail(1)
-        temp_score_df['Ticker'] = ticker
-        score_df = pd.concat((score_df, temp_score_df))
+    score_df = pd.concat(
+        read_last_row(file, usecols=['Date', f'Score {rolling_window}']).assign(Ticker=ticker)
+        for ticker, file in zip(all_ticker, score_paths)
+    )
     
     assert score_df['Date'].nunique() == 1
     score_date = score_df['Date'].unique()[0]
@@ -85,11 +86,10 @@ def _generate_close_data() -> pd.DataFrame:
     label_paths = Path('data/stock/label').rglob('*.csv')
     all_tickers = [file.stem for file in Path('data/stock/label').rglob('*.csv')]
 
-    all_close_df = pd.DataFrame()
-    for ticker, file in zip(all_tickers, label_paths):
-        close_df = pd.read_csv(file, usecols=['Date', 'Close']).tail(1)
-        close_df['Ticker'] = ticker
-        all_close_df = pd.concat((all_close_df, close_df))
+    all_close_df = pd.concat(
+        read_last_row(file, usecols=['Date', 'Close']).assign(Ticker=ticker)
+        for ticker, file in zip(all_tickers, label_paths)
+    )
     
     # assert all_close_df['Date'].nunique() == 1
     all_close_df.drop(columns=['Date'], inplace=True)
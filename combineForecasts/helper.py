@@ -42,7 +42,7 @@ def _get_ticker_available_on_all_forecasts(label_types: list, rolling_windows: l
     for model_version in [1, 2, 3]:
         for label_type in label_types:
             for window in rolling_windows:
-                all_forecast_path = Path(f'data/stock/forecast/model_v{model_version}/{to_camel(label_type)}/{window}dd/').rglob('*.csv')
+                all_forecast_path = Path(f'data/stock/forecast/model_v{model_version}/{to_camel(label_type)}/{window}dd/').rglob('*.parquet')
                 all_ticker = set([file.stem for file in all_forecast_path])
                 
                 if len(all_intersected_ticker) == 0:
@@ -75,12 +75,12 @@ def _combine_multiple_forecast_for_single_ticker(ticker: str, label_types: list,
             for window in rolling_windows:
                 target_column, threshold_column, positive_label, _ = get_label_config(label_type, window)
                 forecast_column = f'Forecast {positive_label} {window}dd'
-                forecast_path = Path(f'data/stock/forecast/model_v{model_version}/{to_camel(label_type)}/{window}dd/{ticker}.csv')
+                forecast_path = Path(f'data/stock/forecast/model_v{model_version}/{to_camel(label_type)}/{window}dd/{ticker}.parquet')
 
                 if (window == max_window) and (label_type == 'median_gain'):
-                    temp_forecast_df = pd.read_csv(forecast_path, usecols=['Date', forecast_column, target_column, threshold_column])
+                    temp_forecast_df = pd.read_parquet(forecast_path, columns=['Date', forecast_column, target_column, threshold_column])
                 else:
-                    temp_forecast_df = pd.read_csv(forecast_path, usecols=['Date', forecast_column])
+                    temp_forecast_df = pd.read_parquet(forecast_path, columns=['Date', forecast_column])
                 
                 temp_forecast_df.rename(columns={forecast_column: f'{forecast_column} - V{model_version}'}, inplace=True)
                 
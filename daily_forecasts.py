@@ -1,9 +1,10 @@
 import sys
 import argparse
-import subprocess
 from pathlib import Path
 from datetime import datetime
 
+from utils.pipeline import run_pipeline_module
+
 from warnings import simplefilter
 simplefilter("ignore")
 
@@ -83,84 +84,84 @@ def run_step(step_num, args):
     print(f"RUNNING STEP {step_num}: {step['name'].upper()}")
     print(f"{'=' * 80}\n")
 
-    cmd = [sys.executable, "-m", step["module"]]
+    module_args = []
 
     if step['module'] in ["pipeline.train_models", "pipeline.fetch_foreign_flow_non_regular_data"] and args.with_docker:
-        cmd.extend(["--with_docker"])
+        module_args.extend(["--with_docker"])
         
     if step_num == 0:
-        cmd.extend(["--start_date", '2020-01-01'])
+        module_args.extend(["--start_date", '2020-01-01'])
 
     elif step_num == 1:
         pass
     
     elif step_num == 2:
-        cmd.extend(["--process_selected_ticker"])
+        module_args.extend(["--process_selected_ticker"])
 
     elif step_num == 3:
-        cmd.extend(["--windows", '5,10'])
-        cmd.extend(["--target_column", 'Close'])
-        cmd.extend(["--label_types", 'median_gain,median_loss'])
-        cmd.extend(["--forecast_bool"])
+        module_args.extend(["--windows", '5,10'])
+        module_args.extend(["--target_column", 'Close'])
+        module_args.extend(["--label_types", 'median_gain,median_loss'])
+        module_args.extend(["--forecast_bool"])
     
     elif step_num == 4:
-        cmd.extend(["--model_version", '1'])
-        cmd.extend(["--windows", '5,10'])
-        cmd.extend(["--label_types", 'median_gain,median_loss'])
-        cmd.extend(["--csv_folder_path", 'data/stock/label'])
-        cmd.extend(["--min_test_gini", '0'])
+        module_args.extend(["--model_version", '1'])
+        module_args.extend(["--windows", '5,10'])
+        module_args.extend(["--label_types", 'median_gain,median_loss'])
+        module_args.extend(["--csv_folder_path", 'data/stock/label'])
+        module_args.extend(["--min_test_gini", '0'])
     
     elif step_num == 5:
-        cmd.extend(["--model_version", '2'])
-        cmd.extend(["--windows", '5,10'])
-        cmd.extend(["--label_types", 'median_gain,median_loss'])
-        cmd.extend(["--csv_folder_path", 'data/stock/label'])
-        cmd.extend(["--min_test_gini", '0'])
+        module_args.extend(["--model_version", '2'])
+        module_args.extend(["--windows", '5,10'])
+        module_args.extend(["--label_types", 'median_gain,median_loss'])
+        module_args.extend(["--csv_folder_path", 'data/stock/label'])
+        module_args.extend(["--min_test_gini", '0'])
     
     elif step_num == 6:
-        cmd.extend(["--model_version", '3'])
-        cmd.extend(["--windows", '5,10'])
-        cmd.extend(["--label_types", 'median_gain,median_loss'])
-        cmd.extend(["--csv_folder_path", 'data/stock/label'])
-        cmd.extend(["--min_test_gini", '0'])
+        module_args.extend(["--model_version", '3'])
+        module_args.extend(["--windows", '5,10'])
+        module_args.extend(["--label_types", 'median_gain,median_loss'])
+        module_args.extend(["--csv_folder_path", 'data/stock/label'])
+        module_args.extend(["--min_test_gini", '0'])
     
     elif step_num == 7:
-        cmd.extend(["--model_versions", '1,2,3'])
-        cmd.extend(["--windows", '5'])
-        cmd.extend(["--label_types", 'median_gain,median_loss'])
+        module_args.extend(["--model_versions", '1,2,3'])
+        module_args.extend(["--windows", '5'])
+        module_args.extend(["--label_types", 'median_gain,median_loss'])
 
     elif step_num == 8:
-        cmd.extend(["--model_versions", '1,2,3'])
-        cmd.extend(["--windows", '5,10'])
-        cmd.extend(["--label_types", 'median_gain,median_loss'])
+        module_args.extend(["--model_versions", '1,2,3'])
+        module_args.extend(["--windows", '5,10'])
+        module_args.extend(["--label_types", 'median_gain,median_loss'])
     
     elif step_num == 9:
-        cmd.extend(["--model_version", '4'])
-        cmd.extend(["--windows", '5'])
-        cmd.extend(["--label_types", 'median_gain'])
-        cmd.extend(["--csv_folder_path", 'data/stock/combined_forecasts_5dd'])
-        cmd.extend(["--min_test_gini", '0'])
+        module_args.extend(["--model_version", '4'])
+        module_args.extend(["--windows", '5'])
+        module_args.extend(["--label_types", 'median_gain'])
+        module_args.extend(["--csv_folder_path", 'data/stock/combined_forecasts_5dd'])
+        module_args.extend(["--min_test_gini", '0'])
 
     elif step_num == 10:
-        cmd.extend(["--model_version", '4'])
-        cmd.extend(["--windows", '10'])
-        cmd.extend(["--label_types", 'median_gain'])
-        cmd.extend(["--csv_folder_path", 'data/stock/combined_forecasts_10dd'])
-        cmd.extend(["--min_test_gini", '0'])
+        module_args.extend(["--model_version", '4'])
+        module_args.extend(["--windows", '10'])
+        module_args.extend(["--label_types", 'median_gain'])
+        module_args.extend(["--csv_folder_path", 'data/stock/combined_forecasts_10dd'])
+        module_args.extend(["--min_test_gini", '0'])
     
     elif step_num == 11:
         pass
 
     elif step_num == 12:
-        cmd.extend(["--model_version", '4'])
-        cmd.extend(["--windows", '5,10'])
+        module_args.extend(["--model_version", '4'])
+        module_args.extend(["--windows", '5,10'])
 
-    try:
-        subprocess.run(cmd, check=True)
+    return_code = run_pipeline_module(step["module"], module_args, args.in_process)
+    if return_code == 0:
         print(f"\nStep {step_num} completed")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"\nStep {step_num} failed with exit code {e.returncode}")
+    else:
+        print(f"\nStep {step_num} failed with exit code {return_code}")
         return False
 
 
@@ -177,7 +178,15 @@ def main():
         help="A boolean for stating whether the system uses docker. If True, than the program wouldn't us multiprocessing"
     )
 
-    parser.set_defaults(with_docker=False)
+    parser.add_argument(
+        "--in_process",
+        "--in-process",
+        dest='in_process',
+        action='store_true',
+        help="A boolean for running every step inside this Python process, so imports are only paid once. If False, every step runs in its own Python process"
+    )
+
+    parser.set_defaults(with_docker=False, in_process=False)
     
     args = parser.parse_args()
 
@@ -27,7 +27,7 @@ def _get_all_active_market_date(ohlcv_data_dir: str = 'data/stock/OHLCV') -> lis
     
     all_dates = set()
     for ohlcv_data_path in all_ohlcv_data_path:
-        acquired_dates = set(pd.read_csv(ohlcv_data_path, usecols=['Date'])['Date'].unique().tolist())
+        acquired_dates = set(pd.read_csv(ohlcv_data_path, usecols=['Date'], engine='pyarrow', dtype={'Date': str})['Date'].unique().tolist())
         all_dates.update(acquired_dates)
 
     all_dates = list(acquired_dates)
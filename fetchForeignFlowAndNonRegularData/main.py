@@ -27,8 +27,9 @@ def fetch_foreign_flow_and_non_regular_ticker_data(active_market_dates: list, ra
 
     for active_market_date in active_market_dates:
         try:
-            year = datetime.strptime(active_market_date, '%Y-%m-%d').year
-            month = datetime.strptime(active_market_date, '%Y-%m-%d').month
+            parsed_active_market_date = datetime.fromisoformat(active_market_date)
+            year = parsed_active_market_date.year
+            month = parsed_active_market_date.month
                 
             _select_year_month_on_web(driver, year, month)
                     
@@ -1,14 +1,123 @@
 import os
+import hashlib
+import threading
+import numpy as np
 import pandas as pd
 import yfinance as yf
 from pathlib import Path
 from curl_cffi import requests
 from datetime import datetime, timedelta
 
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
+_TICKERS = {}
+_TICKERS_LOCK = threading.Lock()
+_CACHE_FOLDER = Path(".cache/yfinance")
+_PRICE_COLUMNS = ["Open", "High", "Low", "Close"]
+
+def _get_session() -> requests.Session:
+    """
+    (Internal Helper) Get the browser-impersonating session of the current process, creating it on first use
+
+    yfinance keeps a single process-wide YfData that holds the session together with its cookie and crumb, and every
+    Ticker built with a session swaps that session in. All download threads of a process therefore share this one
+    session, which curl_cffi makes thread-safe by giving each thread its own curl handle. The session is kept per
+    process id, so workers forked from a process that already holds a session open their own connections instead
+    of sharing its sockets.
+
+    Returns:
+        requests.Session: A session configured for yfinance usage
+    """
+    pid = os.getpid()
+    if pid not in _SESSIONS:
+        with _SESSIONS_LOCK:
+            if pid not in _SESSIONS:
+                _SESSIONS[pid] = requests.Session(impersonate="chrome123")
+
+    return _SESSIONS[pid]
+
+def _get_ticker(symbol: str) -> yf.Ticker:
+    """
+    (Internal Helper) Get the yfinance Ticker of a symbol for the current process, creating it on first use
+
+    Reusing the Ticker keeps the metadata it has already resolved, and it is bound to the session of the same process.
+
+    Args:
+        symbol (str): The Yahoo Finance symbol (e.g., 'BBCA.JK')
+
+    Returns:
+        yf.Ticker: The Ticker object bound to the session of the current process
+    """
+    key = (os.getpid(), symbol)
+    if key not in _TICKERS:
+        with _TICKERS_LOCK:
+            if key not in _TICKERS:
+                _TICKERS[key] = yf.Ticker(symbol, session=_get_session())
+
+    return _TICKERS[key]
+
+def _get_cache_path(ticker: str, start_date: str) -> Path:
+    """
+    (Internal Helper) Get the path of the cached download history of a ticker
+
+    The cache is keyed by ticker and start date only, so every run from the same start date extends the same file.
+
+    Args:
+        ticker (str): A ticker for an ticker (e.g., 'BBCA')
+        start_date (str): The start date for the data in 'YYYY-MM-DD' format
+
+    Returns:
+        Path: The path of the Parquet cache file
+    """
+    cache_key = hashlib.md5(f"{ticker}:{start_date}".encode()).hexdigest()
+
+    return _CACHE_FOLDER / ticker / f"{cache_key}.parquet"
+
+def _download_ticker_data(ticker: str, start: datetime, end: datetime) -> pd.DataFrame:
+    """
+    (Internal Helper) Download OHLCV ticker data from Yahoo Finance, with the Date as a column
+
+    Args:
+        ticker (str): A ticker for an ticker (e.g., 'BBCA')
+        start (datetime): The first date to download
+        end (datetime): The date the download stops at, exclusive
+
+    Returns:
+        pd.DataFrame: A DataFrame containing the downloaded OHLCV data
+    """
+    data = _get_ticker(f"{ticker}.JK").history(start=start, end=end)
+
+    data.drop(columns=["Dividends", "Stock Splits", "Capital Gains"], errors="ignore", inplace=True)
+
+    data.reset_index(inplace=True)
+
+    return data
+
+def _save_cached_ticker_data(cache_path: Path, data: pd.DataFrame) -> None:
+    """
+    (Internal Helper) Save the completed trading days of a download to the cache
+
+    Today's row is left out, since its prices keep changing until the market closes.
+
+    Args:
+        cache_path (Path): The path of the Parquet cache file
+        data (pd.DataFrame): The downloaded OHLCV data
+    """
+    today = pd.Timestamp.now(tz=data["Date"].dt.tz).normalize()
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_file_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    data[data["Date"] < today].to_parquet(temporary_file_path, index=False)
+    os.replace(temporary_file_path, cache_path)
+
 def _fetch_ticker_data(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
     """
     (Internal Helper) fetch OHLCV ticker data from Yahoo Finance for a given ticker
 
+    The completed trading days are cached on disk, so a later run only downloads the days after the last cached one.
+    That download starts at the last cached day; Yahoo back-adjusts historical prices for dividends and splits, so if
+    the prices of that day no longer match the cache, the whole history is downloaded again.
+
     Args:
         ticker (str): A ticker for an ticker (e.g., 'BBCA')
         start_date (str): The start date for the data in 'YYYY-MM-DD' format
@@ -17,24 +126,40 @@ def _fetch_ticker_data(ticker: str, start_date: str, end_date: str) -> pd.DataFr
     Returns:
         pd.DataFrame: A DataFrame containing the cleaned historical stock data, or None if the download fails
     """
-    session = requests.Session(impersonate="chrome123")
-    ticker_yf = yf.Ticker(f"{ticker}.JK", session=session)
-
-    start = datetime.strptime(start_date, "%Y-%m-%d")
+    start = datetime.fromisoformat(start_date)
     
     if end_date != "":
-        end = datetime.strptime(end_date, "%Y-%m-%d")
+        end = datetime.fromisoformat(end_date)
     else:
         end = datetime.now()
 
-    data = ticker_yf.history(start=start, end=end)
+    cache_path = _get_cache_path(ticker, start_date)
+    try:
+        cached_data = pd.read_parquet(cache_path)
+    except OSError:
+        cached_data = None
 
-    columns_to_drop = ["Dividends", "Stock Splits", "Capital Gains"]
-    for col in columns_to_drop:
-        if col in data.columns:
-            data.drop(columns=[col], inplace=True)
+    if cached_data is None or cached_data.empty:
+        data = _download_ticker_data(ticker, start, end)
+        _save_cached_ticker_data(cache_path, data)
 
-    data.reset_index(inplace=True)
-    data["Date"] = data["Date"].dt.date
-    
-    return data
\ No newline at end of file
+        return data
+
+    end_timestamp = pd.Timestamp(end, tz=cached_data["Date"].dt.tz)
+    last_cached_date = cached_data["Date"].iloc[-1]
+    if end_timestamp <= last_cached_date:
+        return cached_data[cached_data["Date"] < end_timestamp].reset_index(drop=True)
+
+    recent_data = _download_ticker_data(ticker, last_cached_date.to_pydatetime().replace(tzinfo=None), end)
+    is_unadjusted = not recent_data.empty \
+                        and recent_data["Date"].iloc[0] == last_cached_date \
+                        and np.allclose(recent_data[_PRICE_COLUMNS].iloc[0], cached_data[_PRICE_COLUMNS].iloc[-1], rtol=1e-6)
+
+    if is_unadjusted:
+        data = pd.concat((cached_data.iloc[:-1], recent_data), ignore_index=True)
+    else:
+        data = _download_ticker_data(ticker, start, end)
+
+    _save_cached_ticker_data(cache_path, data)
+
+    return data
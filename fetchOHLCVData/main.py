@@ -21,7 +21,7 @@ def fetch_ticker_data(args_tuple):
         df = _fetch_ticker_data(ticker, start_date=start_date, end_date=end_date)
     
         csv_file_path = (Path(csv_folder_path) / ticker).with_suffix('.csv')
-        df.to_csv(csv_file_path, index=False)
+        df.to_csv(csv_file_path, index=False, date_format="%Y-%m-%d")
 
         return (
             ticker, 
@@ -1,9 +1,24 @@
 import shutil
-import pickle
 import pandas as pd
 from pathlib import Path
+from functools import lru_cache
+from itertools import product
+from concurrent.futures import ThreadPoolExecutor, Executor, wait, FIRST_COMPLETED
 from camel_converter import to_camel
 
+@lru_cache(maxsize=None)
+def _get_camel_label(label_type: str) -> str:
+    """
+    (Internal Helper) Convert a label type into its camel case folder name, cached since it is repeated for every saved forecast
+
+    Args:
+        label_type (str): The label used to develop the model
+
+    Returns:
+        str: The camel case version of the label type
+    """
+    return to_camel(label_type)
+
 def _ensure_directories_exist(model_version: int, label_types: str, windows: int) -> None:
     """
     (Internal Helper) Ensure all required directories exist before forecasting, if not then it will create the directory
@@ -14,18 +29,20 @@ def _ensure_directories_exist(model_version: int, label_types: str, windows: int
         windows (int): The rolling window used to create the label
     """
     for label_type in label_types:
-        camel_label = to_camel(label_type)
+        camel_label = _get_camel_label(label_type)
         for window in windows:
             folder_path = Path(f"data/stock/forecast/model_v{model_version}/{camel_label}/{window}dd")
 
-            if folder_path.exists():
+            try:
                 shutil.rmtree(folder_path)
+            except FileNotFoundError:
+                pass
                 
             folder_path.mkdir(parents=True, exist_ok=True)
         
     return
 
-def _load_model_performance(model_version: int, label_type: str, window: int, min_test_gini: float = None) -> list:
+def _load_model_performance(model_version: int, label_type: str, window: int, min_test_gini: float = None) -> set:
     """
     (Internal Helper) Load model performance data and filter by minimum Gini.
 
@@ -36,29 +53,31 @@ def _load_model_performance(model_version: int, label_type: str, window: int, mi
         min_test_gini (float): Minimum test Gini threshold (None to include all)
 
     Returns:
-        list: List of ticker codes that meet the criteria
+        set: Set of ticker codes that meet the criteria
     """
-    camel_label = to_camel(label_type)
+    camel_label = _get_camel_label(label_type)
     performance_path = Path(f"data/stock/model_v{model_version}/performance/{camel_label}/{window}dd.csv")
 
     if not performance_path.exists():
         print(f"WARNING: Performance file not found: {performance_path}")
-        return []
+        return set()
 
-    performance_df = pd.read_csv(performance_path)
+    performance_df = pd.read_csv(performance_path, usecols=["Ticker", "Test - Gini"])
 
     if min_test_gini is not None:
-        filtered_df = performance_df[performance_df["Test - Gini"] >= min_test_gini]
-        filtered_df = filtered_df.sort_values("Test - Gini", ascending=False)
-        return filtered_df["Ticker"].unique().tolist()
-    else:
-        return performance_df["Ticker"].unique().tolist()
+        performance_df = performance_df[performance_df["Test - Gini"] >= min_test_gini]
+
+    return set(performance_df["Ticker"].to_numpy())
 
 
 def _get_filtered_ticker_list(model_version: int, label_types: str, windows: int, min_test_gini: float = None) -> list:
     """
     (Internal Helper) Get intersection of ticker codes that meet criteria across all label types and windows.
 
+    The performance files are read concurrently by a small thread pool since they are short disk-bound reads.
+    The intersection is built incrementally and stops as soon as it becomes empty, cancelling the reads
+    that have not started yet once no ticker can meet the criteria anymore.
+
     Args:
         model_version (int): The version of model being developed
         label_types (str): The label used to develop the model
@@ -68,24 +87,64 @@ def _get_filtered_ticker_list(model_version: int, label_types: str, windows: int
     Returns:
         list: List of ticker codes that have models meeting criteria for all combinations
     """
-    all_ticker_sets = []
+    common_ticker = None
 
-    for label_type in label_types:
-        for window in windows:
-            ticker_list = _load_model_performance(model_version, label_type, window, min_test_gini)
-            if ticker_list:
-                all_ticker_sets.append(set(ticker_list))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        ticker_sets = executor.map(
+            lambda combination: _load_model_performance(model_version, *combination, min_test_gini),
+            product(label_types, windows),
+        )
 
-    if not all_ticker_sets:
+        for ticker_set in ticker_sets:
+            if not ticker_set:
+                continue
+
+            common_ticker = ticker_set if common_ticker is None else common_ticker & ticker_set
+            if not common_ticker:
+                executor.shutdown(cancel_futures=True)
+                return []
+
+    if common_ticker is None:
         return []
 
-    common_ticker = set.intersection(*all_ticker_sets)
-    return sorted(list(common_ticker))
+    return sorted(common_ticker)
+
+
+def _map_unordered_bounded(executor: Executor, function: callable, tasks: iter, buffer_size: int):
+    """
+    (Internal Helper) Run tasks on an executor and yield their results in completion order,
+    keeping at most buffer_size tasks submitted at any time so finished results never pile up in memory
+
+    Args:
+        executor (Executor): The executor used to run the tasks
+        function (callable): The function applied to every task
+        tasks (iter): An iterable of arguments, each one passed to function
+        buffer_size (int): The maximum number of tasks that are submitted but not yet yielded
+
+    Yields:
+        any: The result of function for each task, as soon as it is done
+    """
+    tasks = iter(tasks)
+    pending = set()
+
+    for task in tasks:
+        pending.add(executor.submit(function, task))
+        if len(pending) >= buffer_size:
+            break
+
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            next_task = next(tasks, None)
+            if next_task is not None:
+                pending.add(executor.submit(function, next_task))
+
+            yield future.result()
 
 
 def _save_forecast(forecast_df: pd.DataFrame, model_version: int, label_type: str, window: int, ticker: str) -> None:
     """
-    (Internal Helper) Save or append forecast results to CSV
+    (Internal Helper) Save forecast results to a columnar Parquet file
 
     Args:
         forecast_df (pd.DataFrame): A pandas dataframe containing the forecasted value
@@ -94,8 +153,8 @@ def _save_forecast(forecast_df: pd.DataFrame, model_version: int, label_type: st
         window (int): The rolling window used to create the label
         ticker (str): The name of the ticker inside the forecast_df
     """
-    camel_label = to_camel(label_type)
-    filepath = Path(f"data/stock/forecast/model_v{model_version}/{camel_label}/{window}dd/{ticker}.csv")
-    forecast_df.to_csv(filepath, index=False)
+    camel_label = _get_camel_label(label_type)
+    filepath = Path(f"data/stock/forecast/model_v{model_version}/{camel_label}/{window}dd/{ticker}.parquet")
+    forecast_df.to_parquet(filepath, index=False)
 
     return
\ No newline at end of file
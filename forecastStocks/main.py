@@ -1,109 +1,189 @@
-import pickle
+import joblib
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from camel_converter import to_camel
+from forecastStocks.helper import _get_camel_label
+from utils.io import read_csv_parquet_cached
 from utils.pipeline import get_label_config
 
-def process_single_ticker(args_tuple):
+_MODELS = {}
+_POSITIVE_LABEL_INDEX = {}
+
+def _get_positive_label_index(model: any, positive_label: str) -> int:
     """
-    Forecast an ticker based on the label_type and window combination using the developed model.
+    (Internal Helper) Get the column of predict_proba that holds the probability of the positive label
 
     Args:
-        args_tuple: Tuple containing (ticker, label_type, window, feature_columns)
+        model (any): The trained classification model
+        positive_label (str): The positive label of the model's target
 
     Returns:
-        Tuple of (ticker, label_type, window, success, message, forecast_data_dict)
+        int: The index of the positive label inside model.classes_
     """
-    model_version, csv_folder_path, model_identifier, ticker, label_type, window, feature_columns = args_tuple
+    matches = np.flatnonzero(np.asarray(model.classes_) == positive_label)
+    if len(matches) == 0:
+        raise ValueError(f"{positive_label} is not in the model classes")
+
+    return int(matches[0])
 
+def load_models(model_version: int, model_identifiers: list, label_types: list, windows: list) -> int:
+    """
+    Load every model required for forecasting into the module-level cache, so each model is deserialized once per run.
+    The predict_proba column of the positive label is resolved at the same time.
+
+    Args:
+        model_version (int): The version of model used for forecasting
+        model_identifiers (list): A list of the model identifiers (ticker, industry or IHSG)
+        label_types (list): A list of label types used to develop the models
+        windows (list): A list of rolling windows used to create the labels
+
+    Returns:
+        int: The number of models loaded into the cache
+    """
+    _MODELS.clear()
+    _POSITIVE_LABEL_INDEX.clear()
+    for label_type in label_types:
+        camel_label = _get_camel_label(label_type)
+        for window in windows:
+            _, _, positive_label, _ = get_label_config(label_type, window)
+            for model_identifier in model_identifiers:
+                model_path = Path(f"data/stock/model_v{model_version}/{camel_label}/{model_identifier}-{window}dd.pkl")
+                if not model_path.exists():
+                    continue
+
+                model = joblib.load(model_path, mmap_mode='r')
+                _MODELS[(model_version, camel_label, model_identifier, window)] = model
+                if positive_label in model.classes_:
+                    _POSITIVE_LABEL_INDEX[(model_version, camel_label, model_identifier, window)] = _get_positive_label_index(model, positive_label)
+
+    return len(_MODELS)
+
+def _read_forecasting_data(csv_folder_path: str, ticker: str, feature_columns: list) -> (pd.DataFrame, str):
+    """
+    (Internal Helper) Read and validate the data of a ticker that is going to be forecasted
+
+    Args:
+        csv_folder_path (str): The folder containing the ticker's data
+        ticker (str): The name of the ticker to read
+        feature_columns (list): A list of column names used as features by the model
+
+    Returns:
+        Tuple of (csv_data, message), where csv_data is None if the data could not be used
+    """
     try:
-        target_col, threshold_col, positive_label, negative_label = get_label_config(
-            label_type, window
-        )
+        csv_file_path = Path(f"{csv_folder_path}/{ticker}.csv")
+        csv_data = read_csv_parquet_cached(csv_file_path)
+        if csv_data.empty:
+            return None, "CSV file data is empty"
 
-        camel_label = to_camel(label_type)
-        model_path = Path(f"data/stock/model_v{model_version}/{camel_label}/{model_identifier}-{window}dd.pkl")
-
-        if not Path(model_path).exists():
-            return (
-                identifier,
-                label_type,
-                window,
-                False,
-                f"Model not found: {model_path}",
-                None,
-            )
+    except FileNotFoundError:
+        return None, f"CSV file data not found: {csv_file_path}"
 
-        with open(model_path, "rb") as f:
-            model = pickle.load(f)
-
-        try:
-            csv_file_path = Path(f"{csv_folder_path}/{ticker}.csv")
-            if not Path(csv_file_path).exists():
-                return (
-                    ticker,
-                    label_type,
-                    window,
-                    False,
-                    f"CSV file data not found: {csv_file_path}",
-                    None,
-                )
+    except Exception as e:
+        return None, f"Failed to read data: {str(e)}"
 
-            csv_data = pd.read_csv(csv_file_path)
-            if csv_data.empty:
-                return (
-                    ticker,
-                    label_type,
-                    window,
-                    False,
-                    "CSV file data is empty",
-                    None,
-                )
+    missing_features = [col for col in feature_columns if col not in csv_data.columns]
+    if missing_features:
+        return None, f"Missing features: {missing_features[:5]}..."
 
-        except Exception as e:
-            return (
-                ticker,
-                label_type,
-                window,
-                False,
-                f"Failed to read data: {str(e)}",
-                None,
-            )
+    return csv_data, ""
 
-        missing_features = [col for col in feature_columns if col not in csv_data.columns]
-        if missing_features:
-            return (
-                ticker,
-                label_type,
-                window,
-                False,
-                f"Missing features: {missing_features[:5]}...",
-                None,
-            )
+def process_ticker_batch(args_tuple):
+    """
+    Forecast a batch of tickers sharing the same model identifier, for every label_type and window combination.
 
-        forecast_column_name = f"Forecast {positive_label} {window}dd"
-        positive_label_index = list(model.classes_).index(positive_label)
+    The data of each ticker is read once and its features are stacked into a single matrix, which is then
+    reused for every label_type and window so predict_proba is called once per model for the whole batch.
+    The models are taken from the cache filled by load_models; a model that was not preloaded is read from disk
+    once and then kept in the same cache for the following batches.
 
-        forecast_proba = model.predict_proba(csv_data[feature_columns].values) \
-                                [:, positive_label_index]
+    Args:
+        args_tuple: Tuple containing (model_version, csv_folder_path, model_identifier, tickers, label_types, windows, feature_columns)
 
-        csv_data[forecast_column_name] = forecast_proba
+    Returns:
+        List of tuples of (ticker, label_type, window, success, message, forecast_data_dict)
+    """
+    model_version, csv_folder_path, model_identifier, tickers, label_types, windows, feature_columns = args_tuple
+
+    results = []
+    loaded_data = []
+    for ticker in tickers:
+        csv_data, message = _read_forecasting_data(csv_folder_path, ticker, feature_columns)
+        if csv_data is None:
+            results.extend(
+                (ticker, label_type, window, False, message, None)
+                for label_type in label_types
+                for window in windows
+            )
+        else:
+            loaded_data.append((ticker, csv_data))
 
-        return (
-            ticker,
-            label_type,
-            window,
-            True,
-            "Forecast Succeeded",
-            csv_data,
-        )
+    if not loaded_data:
+        return results
 
+    try:
+        feature_matrix = np.vstack([csv_data[feature_columns].to_numpy(dtype=np.float32) for _, csv_data in loaded_data])
+        row_offsets = np.cumsum([0] + [len(csv_data) for _, csv_data in loaded_data])
     except Exception as e:
-        return (
-            ticker, 
-            label_type, 
-            window, 
-            False, 
-            f"Error: {str(e)}", 
-            None
-        )
\ No newline at end of file
+        results.extend(
+            (ticker, label_type, window, False, f"Error: {str(e)}", None)
+            for ticker, _ in loaded_data
+            for label_type in label_types
+            for window in windows
+        )
+        return results
+
+    for label_type in label_types:
+        camel_label = _get_camel_label(label_type)
+        for window in windows:
+            combination_results = []
+            try:
+                target_col, threshold_col, positive_label, negative_label = get_label_config(
+                    label_type, window
+                )
+
+                model = _MODELS.get((model_version, camel_label, model_identifier, window))
+
+                if model is None:
+                    model_path = Path(f"data/stock/model_v{model_version}/{camel_label}/{model_identifier}-{window}dd.pkl")
+                    if not Path(model_path).exists():
+                        results.extend(
+                            (ticker, label_type, window, False, f"Model not found: {model_path}", None)
+                            for ticker, _ in loaded_data
+                        )
+                        continue
+
+                    model = joblib.load(model_path, mmap_mode='r')
+                    _MODELS[(model_version, camel_label, model_identifier, window)] = model
+
+                forecast_column_name = f"Forecast {positive_label} {window}dd"
+                positive_label_index = _POSITIVE_LABEL_INDEX.get((model_version, camel_label, model_identifier, window))
+                if positive_label_index is None:
+                    positive_label_index = _get_positive_label_index(model, positive_label)
+
+                forecast_proba = model.predict_proba(feature_matrix) \
+                                        [:, positive_label_index]
+
+                for (ticker, csv_data), start, end in zip(loaded_data, row_offsets[:-1], row_offsets[1:]):
+                    forecast_data = csv_data.assign(**{forecast_column_name: forecast_proba[start:end]})
+
+                    combination_results.append((
+                        ticker,
+                        label_type,
+                        window,
+                        True,
+                        "Forecast Succeeded",
+                        forecast_data,
+                    ))
+
+            except Exception as e:
+                processed_tickers = {result[0] for result in combination_results}
+                combination_results.extend(
+                    (ticker, label_type, window, False, f"Error: {str(e)}", None)
+                    for ticker, _ in loaded_data
+                    if ticker not in processed_tickers
+                )
+
+            results.extend(combination_results)
+
+    return results
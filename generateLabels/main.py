@@ -2,6 +2,7 @@ import os
 import numpy as np
 import pandas as pd
 from pathlib import Path
+from utils.io import write_csv_with_parquet_cache
 
 from generateLabels.helper import _generate_labels_based_on_label_type
 
@@ -30,10 +31,11 @@ def process_single_ticker(args_tuple):
         technical_path = (Path(technical_folder_path) / ticker).with_suffix('.csv')
         labels_path = (Path(labels_folder_path) / ticker).with_suffix('.csv')
         
-        if not technical_path.is_file():
+        try:
+            technical_df = pd.read_csv(technical_path)
+        except FileNotFoundError:
             return (ticker, False, f"{ticker} - Technical file not found", 0)
 
-        technical_df = pd.read_csv(technical_path)
         if technical_df.empty:
             return (ticker, False, f"{ticker} - Technical data file is empty", 0)
 
@@ -57,7 +59,7 @@ def process_single_ticker(args_tuple):
                 0,
             )
 
-        labels_df.to_csv(labels_path, index=False)
+        write_csv_with_parquet_cache(labels_df, labels_path)
         num_rows = len(labels_df)
 
         return (
@@ -34,13 +34,15 @@ def _prepare_data(window: str):
     selected_columns = ['Date', 'Ticker', feature_col, target_col]
 
     forecast_dir = Path(f'data/stock/forecast/model_v4/medianGain/{window}')
-    all_file_paths = list(forecast_dir.rglob('*.csv'))
-
-    all_data = pd.DataFrame()
-    for file_path in all_file_paths:
-        data = pd.read_csv(file_path)
-        data['Ticker'] = file_path.stem
-        all_data = pd.concat((all_data, data), ignore_index=True)
+    all_file_paths = list(forecast_dir.rglob('*.parquet'))
+
+    all_data = pd.concat(
+        (
+            pd.read_parquet(file_path, columns=['Date', feature_col, target_col]).assign(Ticker=file_path.stem)
+            for file_path in all_file_paths
+        ),
+        ignore_index=True
+    )
 
     splits = get_split_dates(target_col)
     train_val_mask, train_mask, val_mask, test_mask, forecast_mask = get_split_masks(all_data, splits)
@@ -83,10 +83,13 @@ def main():
         for ticker in all_ticker
     ]
 
+    # Each ticker only reads and joins a few forecast files, so tasks are dispatched in chunks to cut queue round-trips
+    chunksize = max(1, len(process_args) // (args.workers * 4))
+
     with Pool(processes=args.workers) as pool:
         results = list(
             tqdm(
-                pool.imap(process_single_ticker, process_args),
+                pool.imap_unordered(process_single_ticker, process_args, chunksize=chunksize),
                 total=len(process_args),
                 desc="Post Process Forecasts",
                 unit="ticker",
@@ -2,7 +2,7 @@ import shutil
 import argparse
 from tqdm import tqdm
 from pathlib import Path
-from multiprocessing import Pool, cpu_count
+from multiprocessing.pool import ThreadPool
 
 from fetchOHLCVData.main import fetch_ticker_data
 
@@ -42,8 +42,8 @@ if __name__ == "__main__":
     parser.add_argument(
         "--workers",
         type=int,
-        default=cpu_count(),
-        help="Number of parallel workers to use (default: CPU count)",
+        default=16,
+        help="Number of parallel download threads to use (default: 16)",
     )
 
     args = parser.parse_args()
@@ -67,7 +67,7 @@ if __name__ == "__main__":
     print(f"Starting parallel fetch with {args.workers} workers for {len(ticker_list)} tickers")
     print()
 
-    with Pool(processes=args.workers) as pool:
+    with ThreadPool(processes=args.workers) as pool:
         results = list(
             tqdm(
                 pool.imap(fetch_ticker_data, fetch_args),
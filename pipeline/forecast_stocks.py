@@ -1,16 +1,17 @@
 import argparse
 import numpy as np
-import pandas as pd
 from tqdm import tqdm
-from pathlib import Path
-from multiprocessing import Pool, cpu_count
+from multiprocessing import cpu_count
+from concurrent.futures import ThreadPoolExecutor
 
-from forecastStocks.main import process_single_ticker
+from utils.io import read_csv_cached
+from forecastStocks.main import load_models, process_ticker_batch
 from prepareTechnicalIndicators.helper import get_all_technical_indicators
 from combineForecasts.helper import _get_combined_forecasts_features_target_threshold
 from forecastStocks.helper import (
     _ensure_directories_exist, 
     _get_filtered_ticker_list, 
+    _map_unordered_bounded,
     _save_forecast
 )
 
@@ -55,11 +56,18 @@ def main():
         help="Model version to be used for making forecasts",
     )
 
+    parser.add_argument(
+        "--batch_size",
+        type=int,
+        default=16,
+        help="Maximum number of tickers sharing a model that are forecasted within a single task (default: 16)",
+    )
+
     parser.add_argument(
         "--workers",
         type=int,
         default=cpu_count(),
-        help="Number of parallel workers (default: CPU count)",
+        help="Number of parallel worker threads (default: CPU count)",
     )
 
     args = parser.parse_args()
@@ -67,12 +75,12 @@ def main():
     label_types = [lt.strip() for lt in args.label_types.split(",")]
     windows = [int(w.strip()) for w in args.windows.split(",")]
 
-    valid_label_types = ["median_gain", "median_loss"]
-    for label_type in label_types:
-        if label_type not in valid_label_types:
-            print(f"ERROR: Invalid label type: {label_type}")
-            print(f"   Valid types: {', '.join(valid_label_types)}")
-            return
+    valid_label_types = frozenset(("median_gain", "median_loss"))
+    invalid_label_types = set(label_types) - valid_label_types
+    if invalid_label_types:
+        print(f"ERROR: Invalid label types: {', '.join(sorted(invalid_label_types))}")
+        print(f"   Valid types: {', '.join(sorted(valid_label_types))}")
+        return
 
     print("=" * 80)
     print(f"PIPELINE DESCRIPTION: FORECAST USING MODEL V{args.model_version}")
@@ -101,51 +109,62 @@ def main():
     print(f"Found {len(ticker_list)} ticker meeting criteria")
 
     if args.model_version == 1:
-        model_identifier_list = ticker_list
+        tickers_by_model_identifier = {ticker: [ticker] for ticker in ticker_list}
     elif args.model_version == 2:
-        ticker_industry_df = pd.read_csv(Path('data/selected_ticker_and_industry_list.csv'))
+        ticker_industry_df = read_csv_cached('data/selected_ticker_and_industry_list.csv')
         ticker_industry_df = ticker_industry_df[ticker_industry_df['Ticker'].isin(ticker_list)]
-        ticker_list = ticker_industry_df['Ticker'].values.tolist()
-        model_identifier_list = ticker_industry_df['Industry'].values.tolist()
+        tickers_by_model_identifier = ticker_industry_df.groupby('Industry', sort=False)['Ticker'] \
+                                        .agg(list) \
+                                        .to_dict()
+        ticker_list = [ticker for tickers in tickers_by_model_identifier.values() for ticker in tickers]
     elif args.model_version in [3, 4]:
-        model_identifier_list = ['IHSG' for _ in range(len(ticker_list))]
+        tickers_by_model_identifier = {'IHSG': ticker_list}
+
+    num_models = load_models(args.model_version, list(tickers_by_model_identifier.keys()), label_types, windows)
+    print(f"Loaded {num_models} models into memory")
 
     forecast_tasks = []
-    for model_identifier, ticker in zip(model_identifier_list, ticker_list):
-        for label_type in label_types:
-            for window in windows:
-                forecast_tasks.append((args.model_version, args.csv_folder_path, model_identifier, ticker, label_type, window, feature_columns))
+    for model_identifier, model_tickers in tickers_by_model_identifier.items():
+        for i in range(0, len(model_tickers), args.batch_size):
+            ticker_batch = model_tickers[i:i + args.batch_size]
+            forecast_tasks.append((args.model_version, args.csv_folder_path, model_identifier, ticker_batch, label_types, windows, feature_columns))
 
-    total_tasks = len(forecast_tasks)
+    total_tasks = len(ticker_list) * len(label_types) * len(windows)
     print(
         f"\nStarting forecasts for {len(ticker_list)} ticker × {len(label_types)} label types × {len(windows)} windows = {total_tasks} tasks"
     )
+    print(f"Grouped into {len(forecast_tasks)} batches of tickers sharing the same model identifier")
     print(f"Using {args.workers} parallel workers\n")
 
     successful = 0
     failed = 0
-
-    with Pool(processes=args.workers) as pool:
-        results = list(
-            tqdm(
-                pool.imap(process_single_ticker, forecast_tasks),
-                total=total_tasks,
-                desc="Generating forecasts",
-            )
-        )
+    failure_messages = []
+
+    # Model inference and CSV parsing release the GIL, so threads give the same parallelism
+    # without pickling the models, feature matrices and forecasted dataframes between processes.
+    # Batches are written in completion order and only a few are in flight at once, so a slow batch
+    # does not hold back the results of the batches submitted after it
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        for batch_result in tqdm(
+            _map_unordered_bounded(executor, process_ticker_batch, forecast_tasks, buffer_size=args.workers * 2),
+            total=len(forecast_tasks),
+            desc="Generating forecasts",
+        ):
+            for ticker, label_type, window, success, message, forecast_data in batch_result:
+                if success and forecast_data is not None:
+                    successful += 1
+                    _save_forecast(forecast_data, args.model_version, label_type, window, ticker)
+                else:
+                    failed += 1
+                    if failed <= 10:
+                        failure_messages.append(f"FAILED: {ticker} ({label_type}, {window}dd): {message}")
 
     print("\n" + "=" * 80)
     print("FORECAST SUMMARY")
     print("=" * 80)
 
-    for ticker, label_type, window, success, message, forecast_data in results:
-        if success and forecast_data is not None:
-            successful += 1
-            _save_forecast(forecast_data, args.model_version, label_type, window, ticker)
-        else:
-            failed += 1
-            if failed <= 10:
-                print(f"FAILED: {ticker} ({label_type}, {window}dd): {message}")
+    if failure_messages:
+        print("\n".join(failure_messages))
 
     if failed > 10:
         print(f"   ... and {failed - 10} more failures")
@@ -117,10 +117,12 @@ if __name__ == "__main__":
         for ticker in all_tickers
     ]
 
+    chunksize = max(1, len(process_args) // (args.workers * 4))
+
     with Pool(processes=args.workers) as pool:
         results = list(
             tqdm(
-                pool.imap(process_single_ticker, process_args),
+                pool.imap(process_single_ticker, process_args, chunksize=chunksize),
                 total=len(process_args),
                 desc="Generating labels",
                 unit="ticker",
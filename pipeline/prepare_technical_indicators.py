@@ -5,9 +5,11 @@ from argparse import BooleanOptionalAction
 import pandas as pd
 from tqdm import tqdm
 from pathlib import Path
-from multiprocessing import Pool, cpu_count, set_start_method
+from multiprocessing import cpu_count, get_context
 
+from utils.io import read_csv_cached
 from prepareTechnicalIndicators.main import process_single_ticker
+from prepareTechnicalIndicators.helper import _save_technical_indicators
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
@@ -64,7 +66,7 @@ if __name__ == "__main__":
         print(f"Error: No CSV files found in {args.ohlcv_folder_path}")
 
     if args.process_selected_ticker:
-        selected_ticker_to_process_df = pd.read_csv('data/selected_ticker_and_industry_list.csv')
+        selected_ticker_to_process_df = read_csv_cached('data/selected_ticker_and_industry_list.csv')
         selected_tickers = selected_ticker_to_process_df['Ticker'].values
 
         all_tickers_to_process = list(set(selected_tickers).intersection(set(all_tickers)))
@@ -86,12 +88,13 @@ if __name__ == "__main__":
         for ticker in all_tickers_to_process
     ]
 
-    set_start_method('spawn')
+    # The summary does not depend on the order of the tickers, so tasks are dispatched in chunks and collected as they finish
+    chunksize = max(1, len(process_args) // (args.workers * 4))
 
-    with Pool(processes=args.workers) as pool:
+    with get_context('spawn').Pool(processes=args.workers) as pool:
         results = list(
             tqdm(
-                pool.imap(process_single_ticker, process_args),
+                pool.imap_unordered(process_single_ticker, process_args, chunksize=chunksize),
                 total=len(process_args),
                 desc="Generating technical indicators",
                 unit="ticker",
@@ -115,6 +118,13 @@ if __name__ == "__main__":
         else:
             failed_tickers.append((ticker, message))
 
+    if successful_tickers:
+        # Every ticker yields the same indicator columns, so the feature names are saved once from the first output
+        ticker = successful_tickers[0][0]
+        technical_columns = pd.read_csv((Path(args.technical_folder_path) / ticker).with_suffix('.csv'), nrows=0).columns
+        ohlcv_columns = pd.read_csv((Path(args.ohlcv_folder_path) / ticker).with_suffix('.csv'), nrows=0).columns
+        _save_technical_indicators(sorted(set(technical_columns) - set(ohlcv_columns)))
+
     print(f"Successfully processed: {success_count}/{len(all_tickers_to_process)} tickers")
     print(f"Total new rows generated: {total_new_rows}")
 
@@ -1,15 +1,15 @@
 import argparse
 import pandas as pd
 from tqdm import tqdm
-from pathlib import Path
-from camel_converter import to_camel
-from multiprocessing import Pool, cpu_count
+from itertools import product
+from multiprocessing import cpu_count, get_context, get_all_start_methods
 
 from warnings import simplefilter
 simplefilter(action="ignore")
 
-from trainModels.main import process_single_model
-from trainModels.helper import _ensure_directories_exist
+from trainModels.main import process_model_batch, _init_worker
+from trainModels.helper import _ensure_directories_exist, _get_model_path, _get_performance_path, _get_identifiers_with_metrics
+from utils.io import read_csv_cached
 
 def main():
     parser = argparse.ArgumentParser(
@@ -37,6 +37,13 @@ def main():
         help="Number of parallel workers (default: CPU count)",
     )
 
+    parser.add_argument(
+        "--batch_size",
+        type=int,
+        default=8,
+        help="Maximum number of models developed within a single worker task (default: 8)",
+    )
+
     parser.add_argument(
         "--model_version",
         type=int,
@@ -51,79 +58,117 @@ def main():
         help="A boolean for stating whether the system uses docker. If True, than the program wouldn't us multiprocessing"
     )
 
-    parser.set_defaults(with_docker=False)
+    parser.add_argument(
+        "--force",
+        dest='force',
+        action='store_true',
+        help="A boolean for retraining every model. If False, models that have already been developed are skipped"
+    )
+
+    parser.set_defaults(with_docker=False, force=False)
 
     args = parser.parse_args()
 
     label_types = [lt.strip() for lt in args.label_types.split(",")]
     rolling_windows = [int(w.strip()) for w in args.windows.split(",")]
     
-    valid_label_types = [ "median_gain", "median_loss"]
-    for label_type in label_types:
-        if label_type not in valid_label_types:
-            print(f"Error: Invalid label type: {label_type}")
-            return
+    valid_label_types = frozenset(("median_gain", "median_loss"))
+    invalid_label_types = set(label_types) - valid_label_types
+    if invalid_label_types:
+        print(f"Error: Invalid label types: {', '.join(sorted(invalid_label_types))}")
+        return
 
-    _ensure_directories_exist(args.model_version, label_types)
+    _ensure_directories_exist(args.model_version, label_types, args.force)
 
     print("=" * 80)
     print(f"PIPELINE DESCRIPTION: DEVELOP MODEL V{args.model_version}")
     print("=" * 80)
 
     if args.model_version == 1:
-        specified_identifiers = pd.read_csv(Path('data/selected_ticker_and_industry_list.csv')) \
+        specified_identifiers = read_csv_cached('data/selected_ticker_and_industry_list.csv') \
                                     ['Ticker'] \
                                     .unique() \
                                     .tolist()
 
     elif args.model_version == 2:
-        specified_identifiers = pd.read_csv(Path('data/selected_ticker_and_industry_list.csv')) \
+        specified_identifiers = read_csv_cached('data/selected_ticker_and_industry_list.csv') \
                                     ['Industry'] \
                                     .unique() \
                                     .tolist()
     elif args.model_version in [3, 4]:
         specified_identifiers = ['IHSG']
+
     
     print(f"Found {len(specified_identifiers)} identifier to process")
     print(f"Label types: {', '.join(label_types)}")
     print(f"Rolling windows: {', '.join(map(str, rolling_windows))} days")
     
+    # A model is only skipped once both its file and its performance row are saved, so a run that died between
+    # saving the two retrains the model instead of leaving it out of the performance file for good
+    identifiers_with_metrics = {} if args.force else {
+        (label_type, window): _get_identifiers_with_metrics(args.model_version, label_type, window)
+        for label_type, window in product(label_types, rolling_windows)
+    }
+
     args_list = []
-    for identifier in specified_identifiers:
-        for label_type in label_types:
-            for window in rolling_windows:
-                args_list.append((identifier, label_type, window, args.model_version))
+    skipped_models = 0
+    for identifier, label_type, window in product(specified_identifiers, label_types, rolling_windows):
+        if not args.force \
+                and identifier in identifiers_with_metrics[(label_type, window)] \
+                and _get_model_path(args.model_version, label_type, identifier, window).exists():
+            skipped_models += 1
+            continue
+
+        args_list.append((identifier, label_type, window, args.model_version))
+
+    if skipped_models:
+        print(f"Skipping {skipped_models} models that have already been developed (use --force to retrain)")
+
+    if not args_list:
+        print("All models have already been developed")
+        return
+
+    batch_size = max(1, min(args.batch_size, len(args_list) // args.workers))
+    args_batches = [args_list[i:i + batch_size] for i in range(0, len(args_list), batch_size)]
 
     all_failed_processes = []
     all_metrics = {}
 
-    print(f"Workers: {args.workers}\n")
-    with Pool(processes=args.workers) as pool:
-        results = list(
-            tqdm(
-                pool.imap(process_single_model, args_list),
-                    total=len(args_list),
-                    desc="Processing single model",
-                )
-            )
+    # Workers are forked from a small forkserver template rather than from this process, which may already
+    # hold the data of earlier pipeline steps, keeping each worker's memory and copy-on-write faults small
+    start_method = "forkserver" if "forkserver" in get_all_start_methods() else None
 
-    for failed_process, metrics_list in results:
-        all_failed_processes.extend(failed_process)
+    # CatBoost and the search jobs are not bound by threadpoolctl, so every worker gets its share of the cores
+    # instead of each worker starting a thread per core
+    thread_count = max(1, cpu_count() // args.workers)
 
-        for label_type, window, metrics_df in metrics_list:
-            key = (label_type, window)
-            if key not in all_metrics:
-                all_metrics[key] = []
+    print(f"Workers: {args.workers} ({thread_count} threads each)\n")
+    with get_context(start_method).Pool(processes=args.workers, maxtasksperchild=50, initializer=_init_worker, initargs=(thread_count,)) as pool, \
+            tqdm(total=len(args_batches), desc="Processing model batches", mininterval=1.0, smoothing=0) as progress_bar:
+        for failed_process, metrics_list in pool.imap_unordered(process_model_batch, args_batches):
+            progress_bar.update(1)
+            all_failed_processes.extend(failed_process)
 
-            all_metrics[key].append(metrics_df)
+            for label_type, window, metrics_df in metrics_list:
+                key = (label_type, window)
+                if key not in all_metrics:
+                    all_metrics[key] = []
+
+                all_metrics[key].append(metrics_df)
 
     if all_metrics:
         print("\nSaving performance metrics...")
         for (label_type, window), metrics_dfs in all_metrics.items():
-            camel_label = to_camel(label_type)
-            filepath = Path(f"data/stock/model_v{args.model_version}/performance/{camel_label}/{window}dd.csv")
+            filepath = _get_performance_path(args.model_version, label_type, window)
 
             combined_metrics = pd.concat(metrics_dfs, ignore_index=True)
+            if filepath.exists():
+                existing_metrics = pd.read_csv(filepath)
+                existing_metrics = existing_metrics[~existing_metrics["Ticker"].isin(combined_metrics["Ticker"])]
+                combined_metrics = pd.concat((existing_metrics, combined_metrics), ignore_index=True)
+
+            combined_metrics = combined_metrics.sort_values("Ticker", kind="stable") \
+                                    .reset_index(drop=True)
             combined_metrics.to_csv(filepath, index=False)
 
     print(f"\n{'=' * 60}")
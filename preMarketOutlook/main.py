@@ -46,7 +46,7 @@ def _calculate_micro_outlook(rolling_window: int) -> dict:
     if not all_score_paths:
         return {}
 
-    score_test_data = pd.concat((pd.read_csv(file) for file in all_score_paths)).groupby('Date')[f'Score {rolling_window}dd'].mean().to_frame(f'Average Score {rolling_window}dd')
+    score_test_data = pd.concat((pd.read_csv(file, usecols=['Date', f'Score {rolling_window}dd']) for file in all_score_paths)).groupby('Date')[f'Score {rolling_window}dd'].mean().to_frame(f'Average Score {rolling_window}dd')
 
     joined_ihsg_score_data = pd.merge(ihsg_data.dropna(), score_test_data, left_index=True, right_index=True, how='inner')[[f'Median Gain {rolling_window}dd', f'Average Score {rolling_window}dd']]
     
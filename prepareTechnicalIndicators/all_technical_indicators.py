@@ -1,5 +1,3 @@
-import os
-import tempfile
 import numpy as np
 import pandas as pd
 from stock_indicators import Quote
@@ -24,18 +22,22 @@ def _prepare_data_for_generating_stock_indicators(data: pd.DataFrame) -> list:
         list: Converted pandas dataframe ready to be used for generating the technical indicators
     """
     data['Date'] = pd.to_datetime(data['Date'])
-    prepared_data = [
-        Quote(d,o,h,l,c,v) 
-        for d,o,h,l,c,v 
-        in zip(data['Date'], data['Open'], data['High'], data['Low'], data['Close'], data['Volume'])
-    ]
+    prepared_data = list(map(
+        Quote,
+        data['Date'].tolist(),
+        data['Open'].tolist(),
+        data['High'].tolist(),
+        data['Low'].tolist(),
+        data['Close'].tolist(),
+        data['Volume'].tolist(),
+    ))
     
     return prepared_data
 
-def _generate_all_technical_indicators(data, additional_data, prepared_data, technical_indicator):
+def _generate_all_technical_indicators(data, additional_data, prepared_data, close, technical_indicator):
     if technical_indicator == 'price_trends':
         technical_indicator_data = [
-            calculate_atr_trailing_stop(data, prepared_data),
+            calculate_atr_trailing_stop(close, prepared_data),
             calculate_aroon(prepared_data),
             calculate_average_directional_index(prepared_data), 
             calculate_elder_ray_index(prepared_data), 
@@ -44,9 +46,9 @@ def _generate_all_technical_indicators(data, additional_data, prepared_data, tec
 
     elif technical_indicator == 'price_channels':
         technical_indicator_data = [
-            calculate_keltner(data, prepared_data), 
-            calculate_donchian(data, prepared_data),
-            calculate_bollinger_bands(data, prepared_data)
+            calculate_keltner(close, prepared_data), 
+            calculate_donchian(close, prepared_data),
+            calculate_bollinger_bands(close, prepared_data)
         ]
 
     elif technical_indicator == 'oscillators':
@@ -102,38 +104,29 @@ def generate_all_technical_indicators(data: pd.DataFrame, additional_data: pd.Da
     prepared_data = _prepare_data_for_generating_stock_indicators(data)
 
     data = data.copy()
-    data['Date'] = pd.to_datetime(data['Date'])
     data.set_index('Date', inplace=True)
 
     additional_data = additional_data.copy()
     additional_data['Date'] = pd.to_datetime(additional_data['Date'])
     additional_data.set_index('Date', inplace=True)
 
-    original_columns = set(data.columns)
-
-    all_stock_indicators_data = data.copy()
-
     selected_technical_indicators = [
         'price_trends', 'price_channels', 'oscillators', 'volume_based', 'price_transformations', 'additional_technical_indicators', 'momentum'
     ]
-    
+
+    # The close prices are compared against the ATR stop and the Bollinger, Keltner and Donchian bands
+    close = data['Close'].to_numpy()
+
+    # Each indicator is aligned to the stock's dates on its own, so the final concat lines up identical indexes only once
+    aligned_technical_indicator_data = [data]
     for technical_indicator in selected_technical_indicators:
-        technical_indicator_data = _generate_all_technical_indicators(data, additional_data, prepared_data, technical_indicator)
+        technical_indicator_data = _generate_all_technical_indicators(data, additional_data, prepared_data, close, technical_indicator)
         for d in technical_indicator_data:
             cleaned_d = d.reset_index().drop_duplicates('Date').set_index('Date')
-            all_stock_indicators_data = pd.merge(all_stock_indicators_data, cleaned_d, left_index=True, right_index=True, how='left')
+            aligned_technical_indicator_data.append(cleaned_d.reindex(data.index))
 
-    all_stock_indicators_data.dropna(inplace=True)
+    all_stock_indicators_data = pd.concat(aligned_technical_indicator_data, axis=1)
 
-    updated_columns = set(all_stock_indicators_data.columns)
-    feature_columns = sorted(list(updated_columns - original_columns))
-
-    output_path = 'data/technical_indicator_features.txt'
-    dir_name = os.path.dirname(output_path) or '.'
-    with tempfile.NamedTemporaryFile(mode='w', dir=dir_name, suffix='.tmp', delete=False) as tmp_file:
-        for fea_col in feature_columns:
-            tmp_file.write(fea_col + "\n")
-        tmp_path = tmp_file.name
-    os.replace(tmp_path, output_path)
+    all_stock_indicators_data.dropna(inplace=True)
 
     return all_stock_indicators_data
\ No newline at end of file
@@ -1,4 +1,10 @@
+import os
+import tempfile
 import numpy as np
+import pandas as pd
+from operator import attrgetter
+from numpy.lib.stride_tricks import sliding_window_view
+from functools import lru_cache
 
 def identify_historical_trends(data, column, rolling_window, make_bool_up=None, make_bool_down=None):
     """
@@ -17,26 +23,53 @@ def identify_historical_trends(data, column, rolling_window, make_bool_up=None,
     Returns:
         np.array: An array of the classified trends for each period.
     """
-    linreg_gradients = np.array(
-        [
-            np.nan
-            if i < rolling_window
-            else _retrieve_linreg_gradients(data[column].values[i - rolling_window : i])
-            for i in range(len(data))
-        ]
-    )
+    values = np.asarray(data[column].values, dtype=float)
+    linreg_gradients = np.full(len(values), np.nan)
+
+    if len(values) > rolling_window:
+        # The trend at row i is fitted on the rolling_window rows before it
+        windows = sliding_window_view(values, rolling_window)[:len(values) - rolling_window]
+
+        # Closed-form least-squares slope over the same 0-n linspace and 0-1 scaling as _retrieve_linreg_gradients
+        x_centered = np.linspace(0, rolling_window, rolling_window)
+        x_centered -= x_centered.mean()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            data_range = windows.max(axis=1) - windows.min(axis=1)
+            gradients = (windows @ x_centered) / np.dot(x_centered, x_centered) / data_range
+        gradients[data_range == 0] = 0
+
+        # Windows holding NaNs fit on their remaining values only, so they keep the per-window computation
+        for index in np.flatnonzero(np.isnan(data_range)):
+            gradients[index] = _retrieve_linreg_gradients(windows[index])
+
+        linreg_gradients[rolling_window:] = gradients
 
     if make_bool_up:
-        return np.array(
-            [np.nan if np.isnan(val) else float(val > 0) for val in linreg_gradients]
-        )
+        return np.where(np.isnan(linreg_gradients), np.nan, linreg_gradients > 0)
     elif make_bool_down:
-        return np.array(
-            [np.nan if np.isnan(val) else float(val < 0) for val in linreg_gradients]
-        )
+        return np.where(np.isnan(linreg_gradients), np.nan, linreg_gradients < 0)
     return linreg_gradients
 
 
+def identify_historical_trend_directions(data, column, rolling_window):
+    """
+    (Internal Helper) Identifies both the upward and the downward historical trend of a data column from a single
+    computation of the rolling linear regression slopes.
+
+    Args:
+        data (pd.DataFrame): The input DataFrame.
+        column (str): The name of the column to analyze.
+        rolling_window (int): The number of periods to include in the trend calculation.
+
+    Returns:
+        tuple: The arrays returned by identify_historical_trends with make_bool_up and with make_bool_down.
+    """
+    linreg_gradients = identify_historical_trends(data, column, rolling_window)
+    is_missing = np.isnan(linreg_gradients)
+
+    return np.where(is_missing, np.nan, linreg_gradients > 0), np.where(is_missing, np.nan, linreg_gradients < 0)
+
+
 def _retrieve_linreg_gradients(target_data):
     """
     Calculates the slope (gradient) of a data series using an analytical least-squares formula.
@@ -75,15 +108,56 @@ def _retrieve_linreg_gradients(target_data):
     return slope
 
 
-def get_all_technical_indicators():
+def _results_to_dataframe(result, columns: dict) -> pd.DataFrame:
     """
-    Load the saved and generated stock's technical indicators.
+    (Internal Helper) Build a dataframe from the results of a stock_indicators function in a single pass
+
+    Args:
+        result (list): The results returned by a stock_indicators function
+        columns (dict): A mapping of each column name to the result attribute it is read from
 
     Returns:
-        list: A list containing all feature names for the technical indicators.
+        pd.DataFrame: A dataframe with one row per result and one column per attribute
+    """
+    return pd.DataFrame.from_records(map(attrgetter(*columns.values()), result), columns=list(columns))
+
+
+@lru_cache(maxsize=1)
+def _load_technical_indicators() -> tuple:
+    """
+    (Internal Helper) Read the saved technical indicator names once per process, as a fixed-order tuple.
+
+    Returns:
+        tuple: A tuple containing all feature names for the technical indicators.
     """
     feature_file = "data/technical_indicator_features.txt"
     with open(feature_file, "r") as file:
-        feature_columns = [line.strip() for line in file]
+        feature_columns = tuple(line.strip() for line in file)
+
+    return feature_columns
+
+def _save_technical_indicators(feature_columns: list) -> None:
+    """
+    (Internal Helper) Save the names of the generated technical indicators, replacing the previous file atomically
+
+    Args:
+        feature_columns (list): A list containing all feature names for the technical indicators
+    """
+    output_path = "data/technical_indicator_features.txt"
+    dir_name = os.path.dirname(output_path) or '.'
+    with tempfile.NamedTemporaryFile(mode='w', dir=dir_name, suffix='.tmp', delete=False) as tmp_file:
+        for fea_col in feature_columns:
+            tmp_file.write(fea_col + "\n")
+        tmp_path = tmp_file.name
+    os.replace(tmp_path, output_path)
+
+    _load_technical_indicators.cache_clear()
+
+def get_all_technical_indicators():
+    """
+    Load the saved and generated stock's technical indicators.
 
-    return feature_columns
\ No newline at end of file
+    Returns:
+        list: A list containing all feature names for the technical indicators.
+    """
+    return list(_load_technical_indicators())
\ No newline at end of file
@@ -3,6 +3,7 @@ import pandas as pd
 from pathlib import Path
 
 from prepareTechnicalIndicators.all_technical_indicators import generate_all_technical_indicators
+from prepareTechnicalIndicators.additional_technical_indicators import WINDOWS
 
 def process_single_ticker(args_tuple):
     """
@@ -21,7 +22,9 @@ def process_single_ticker(args_tuple):
         foreign_flow_non_regular_path = (Path(foreign_flow_non_regular_folder_path) / ticker).with_suffix('.csv')
         technical_path = (Path(technical_folder_path) / ticker).with_suffix('.csv')
 
-        if not ohlcv_path.is_file():
+        try:
+            ohlcv_df = pd.read_csv(ohlcv_path, engine="pyarrow")
+        except FileNotFoundError:
             return (
                 ticker, 
                 False, 
@@ -29,7 +32,6 @@ def process_single_ticker(args_tuple):
                 0
             )
 
-        ohlcv_df = pd.read_csv(ohlcv_path)
         if ohlcv_df.empty:
             return (
                 ticker, 
@@ -38,7 +40,9 @@ def process_single_ticker(args_tuple):
                 0
             )
 
-        if not foreign_flow_non_regular_path.is_file():
+        try:
+            foreign_flow_non_regular_df = pd.read_csv(foreign_flow_non_regular_path, engine="pyarrow")
+        except FileNotFoundError:
             return (
                 ticker, 
                 False, 
@@ -46,7 +50,6 @@ def process_single_ticker(args_tuple):
                 0
             )
 
-        foreign_flow_non_regular_df = pd.read_csv(foreign_flow_non_regular_path)
         if foreign_flow_non_regular_df.empty:
             return (
                 ticker, 
@@ -65,12 +68,22 @@ def process_single_ticker(args_tuple):
                 0,
             )
 
-        ohlcv_df["Date"] = pd.to_datetime(ohlcv_df["Date"]).dt.strftime("%Y-%m-%d")
-        foreign_flow_non_regular_df["Date"] = pd.to_datetime(foreign_flow_non_regular_df["Date"]).dt.strftime("%Y-%m-%d")
+        # The longest flow window plus its one-day shift has to be filled before any row survives the final dropna
+        if len(foreign_flow_non_regular_df) <= max(WINDOWS):
+            return (
+                ticker,
+                False,
+                f"{ticker} - Not enough history to generate technical indicators ({len(foreign_flow_non_regular_df)} rows, needs more than {max(WINDOWS)})",
+                0,
+            )
+
+        # Dates stay as datetime64 through the indicator generation and are only formatted when written
+        ohlcv_df["Date"] = pd.to_datetime(ohlcv_df["Date"])
+        foreign_flow_non_regular_df["Date"] = pd.to_datetime(foreign_flow_non_regular_df["Date"])
 
         technical_df = generate_all_technical_indicators(ohlcv_df, foreign_flow_non_regular_df)
         technical_df.reset_index(inplace=True)
-        technical_df["Date"] = pd.to_datetime(technical_df["Date"]).dt.strftime("%Y-%m-%d")
+        technical_df["Date"] = technical_df["Date"].dt.strftime("%Y-%m-%d")
         
         technical_df.to_csv(technical_path, index=False)
         num_rows = len(technical_df)
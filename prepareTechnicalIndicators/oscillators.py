@@ -1,13 +1,14 @@
 import numpy as np
-import pandas as pd
 from stock_indicators import indicators
 
+from prepareTechnicalIndicators.helper import _results_to_dataframe
+
 def calculate_relative_strength_index(prepared_data):
     """Calculate RSI with continuous values, binary flags, multi-timeframe, and rate-of-change features."""
     result = indicators.get_rsi(prepared_data)
-    result_df = pd.DataFrame({
-        'Date': [val.date for val in result],
-        'Relative Strength Index': [val.rsi for val in result]
+    result_df = _results_to_dataframe(result, {
+        'Date': 'date',
+        'Relative Strength Index': 'rsi'
     })
     
     result_df.dropna(subset=['Relative Strength Index'], inplace=True)
@@ -35,9 +36,9 @@ def calculate_multi_timeframe_rsi(prepared_data):
 
     for period in rsi_periods:
         result = indicators.get_rsi(prepared_data, lookback_periods=period)
-        rsi_df = pd.DataFrame({
-            'Date': [val.date for val in result],
-            f'RSI {period}': [val.rsi for val in result]
+        rsi_df = _results_to_dataframe(result, {
+            'Date': 'date',
+            f'RSI {period}': 'rsi'
         })
         rsi_df.dropna(subset=[f'RSI {period}'], inplace=True)
         rsi_df = rsi_df.set_index('Date')
@@ -51,9 +52,9 @@ def calculate_multi_timeframe_rsi(prepared_data):
 def calculate_stochastic_oscillator(prepared_data):
     """Calculate Stochastic Oscillator with continuous value alongside binary flags."""
     result = indicators.get_stoch(prepared_data)
-    result_df = pd.DataFrame({
-        'Date': [val.date for val in result],
-        'Stochastic Oscillator': [val.oscillator for val in result]
+    result_df = _results_to_dataframe(result, {
+        'Date': 'date',
+        'Stochastic Oscillator': 'oscillator'
     })
 
     result_df.dropna(subset=['Stochastic Oscillator'], inplace=True)
@@ -1,69 +1,66 @@
 import numpy as np
-import pandas as pd
 from stock_indicators import indicators
 
-from prepareTechnicalIndicators.helper import identify_historical_trends
+from prepareTechnicalIndicators.helper import identify_historical_trend_directions, _results_to_dataframe
 
-def calculate_bollinger_bands(data, prepared_data):
+def calculate_bollinger_bands(close, prepared_data):
     result = indicators.get_bollinger_bands(prepared_data)
-    result_df = pd.DataFrame({
-        'Date': [val.date for val in result],
-        'Upper Band': [val.upper_band for val in result],
-        'Lower Band': [val.lower_band for val in result],    
-        'Width': [val.width for val in result]
+    result_df = _results_to_dataframe(result, {
+        'Date': 'date',
+        'Upper Band': 'upper_band',
+        'Lower Band': 'lower_band',
+        'Width': 'width'
     })
 
     band_range = result_df['Upper Band'] - result_df['Lower Band']
-    result_df['Bollinger Percent B'] = (pd.Series(data['Close'].values) - result_df['Lower Band']) / band_range.replace(0, np.nan)
+    result_df['Bollinger Percent B'] = (close - result_df['Lower Band']) / band_range.replace(0, np.nan)
 
-    result_df['Bollinger Overbought'] = np.array(result_df['Upper Band'].values <= data['Close'].values).astype(int)
-    result_df['Bollinger Oversold'] = np.array(result_df['Lower Band'].values >= data['Close'].values).astype(int)
-    result_df['Width Bollinger Increasing'] = identify_historical_trends(result_df, 'Width', 5, make_bool_up=True)
-    result_df['Width Bollinger Decreasing'] = identify_historical_trends(result_df, 'Width', 5, make_bool_down=True)
+    result_df['Bollinger Overbought'] = (result_df['Upper Band'].values <= close).astype(np.int8)
+    result_df['Bollinger Oversold'] = (result_df['Lower Band'].values >= close).astype(np.int8)
+    result_df['Width Bollinger Increasing'], result_df['Width Bollinger Decreasing'] = identify_historical_trend_directions(result_df, 'Width', 5)
     
     result_df.dropna(subset=['Upper Band', 'Lower Band', 'Width'], inplace=True)
     result_df.drop(columns=['Upper Band', 'Lower Band', 'Width'], inplace=True)
 
     return result_df.set_index('Date')
 
-def calculate_keltner(data, prepared_data):
+def calculate_keltner(close, prepared_data):
     result = indicators.get_keltner(prepared_data)
-    result_df = pd.DataFrame({
-        'Date': [val.date for val in result],
-        'Upper Band': [val.upper_band for val in result],
-        'Lower Band': [val.lower_band for val in result],
-        'Width': [val.width for val in result]
+    result_df = _results_to_dataframe(result, {
+        'Date': 'date',
+        'Upper Band': 'upper_band',
+        'Lower Band': 'lower_band',
+        'Width': 'width'
     })
 
     band_range = result_df['Upper Band'] - result_df['Lower Band']
-    result_df['Keltner Percent B'] = (pd.Series(data['Close'].values) - result_df['Lower Band']) / band_range.replace(0, np.nan)
+    result_df['Keltner Percent B'] = (close - result_df['Lower Band']) / band_range.replace(0, np.nan)
 
-    result_df['Keltner Overbought'] = np.array(result_df['Upper Band'].values <= data['Close'].values).astype(int)
-    result_df['Keltner Oversold'] = np.array(result_df['Lower Band'].values >= data['Close'].values).astype(int)
-    result_df['Width Keltner Increasing'] = identify_historical_trends(result_df, 'Width', 5, make_bool_up=True)
-    result_df['Width Keltner Decreasing'] = identify_historical_trends(result_df, 'Width', 5, make_bool_down=True)
+    result_df['Keltner Overbought'] = (result_df['Upper Band'].values <= close).astype(np.int8)
+    result_df['Keltner Oversold'] = (result_df['Lower Band'].values >= close).astype(np.int8)
+    result_df['Width Keltner Increasing'], result_df['Width Keltner Decreasing'] = identify_historical_trend_directions(result_df, 'Width', 5)
 
     result_df.dropna(subset=['Upper Band', 'Lower Band', 'Width'], inplace=True)
     result_df.drop(columns=['Upper Band', 'Lower Band', 'Width'], inplace=True)
 
     return result_df.set_index('Date')
 
-def calculate_donchian(data, prepared_data):
+def calculate_donchian(close, prepared_data):
     result = indicators.get_donchian(prepared_data)
-    result_df = pd.DataFrame({
-        'Date': [val.date for val in result],
-        'Upper Band': np.array([np.nan if val.upper_band is None else val.upper_band for val in result]).astype(float),
-        'Lower Band': np.array([np.nan if val.lower_band is None else val.lower_band for val in result]).astype(float),
-        'Width': np.array([np.nan if val.width is None else val.width for val in result]).astype(float)
+    result_df = _results_to_dataframe(result, {
+        'Date': 'date',
+        'Upper Band': 'upper_band',
+        'Lower Band': 'lower_band',
+        'Width': 'width'
     })
+    result_df = result_df.astype({'Upper Band': float, 'Lower Band': float, 'Width': float})
 
     band_range = result_df['Upper Band'] - result_df['Lower Band']
-    result_df['Donchian Percent B'] = (pd.Series(data['Close'].values) - result_df['Lower Band']) / band_range.replace(0, np.nan)
+    result_df['Donchian Percent B'] = (close - result_df['Lower Band']) / band_range.replace(0, np.nan)
 
-    result_df['Donchian Overbought'] = np.array(result_df['Upper Band'].values <= data['Close'].values).astype(int)
-    result_df['Donchian Oversold'] = np.array(result_df['Lower Band'].values >= data['Close'].values).astype(int)
-    result_df['Width Donchian Increasing'] = identify_historical_trends(result_df, 'Width', 5, make_bool_up=True)
-    result_df['Width Donchian Decreasing'] = identify_historical_trends(result_df, 'Width', 5, make_bool_down=True)
+    result_df['Donchian Overbought'] = (result_df['Upper Band'].values <= close).astype(np.int8)
+    result_df['Donchian Oversold'] = (result_df['Lower Band'].values >= close).astype(np.int8)
+    result_df['Width Donchian Increasing'], result_df['Width Donchian Decreasing'] = identify_historical_trend_directions(result_df, 'Width', 5)
 
     result_df.dropna(subset=['Upper Band', 'Lower Band', 'Width'], inplace=True)
     result_df.drop(columns=['Upper Band', 'Lower Band', 'Width'], inplace=True)
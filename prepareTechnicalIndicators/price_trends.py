@@ -1,18 +1,19 @@
 import numpy as np
-import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from stock_indicators import indicators
 
-from prepareTechnicalIndicators.helper import identify_historical_trends
+from prepareTechnicalIndicators.helper import identify_historical_trends, _results_to_dataframe
 
-def calculate_atr_trailing_stop(data, prepared_data):
+def calculate_atr_trailing_stop(close, prepared_data):
     result = indicators.get_atr_stop(prepared_data)
-    result_df = pd.DataFrame({
-        'Date': [val.date for val in result],
-        'ATR Stop': [val.atr_stop if val.atr_stop is not None else np.nan for val in result]
+    result_df = _results_to_dataframe(result, {
+        'Date': 'date',
+        'ATR Stop': 'atr_stop'
     })
+    result_df = result_df.astype({'ATR Stop': float})
 
-    result_df['ATR Bullish'] = (result_df['ATR Stop'].values >= data['Close'].values).astype(int)
-    result_df['ATR Bearish'] = (result_df['ATR Stop'].values < data['Close'].values).astype(int)
+    result_df['ATR Bullish'] = (result_df['ATR Stop'].values >= close).astype(np.int8)
+    result_df['ATR Bearish'] = (result_df['ATR Stop'].values < close).astype(np.int8)
     result_df.dropna(subset='ATR Stop', inplace=True)
 
     result_df.drop(columns=['ATR Stop'], inplace=True)    
@@ -21,15 +22,15 @@ def calculate_atr_trailing_stop(data, prepared_data):
 
 def calculate_aroon(prepared_data):
     result = indicators.get_aroon(prepared_data)
-    result_df = pd.DataFrame({
-        'Date': [val.date for val in result],
-        'Aroon Up': [val.aroon_up for val in result],
-        'Aroon Down': [val.aroon_down for val in result]
+    result_df = _results_to_dataframe(result, {
+        'Date': 'date',
+        'Aroon Up': 'aroon_up',
+        'Aroon Down': 'aroon_down'
     })
 
     result_df.dropna(subset=['Aroon Up'], inplace=True)
     aroon_position = result_df['Aroon Up'].values >= result_df['Aroon Down'].values
-    result_df['Aroon Change Position'] = [np.nan] + (aroon_position[:-1] != aroon_position[1:]).astype(int).tolist()
+    result_df['Aroon Change Position'] = np.concatenate(([np.nan], (aroon_position[:-1] != aroon_position[1:]).astype(float)))
     result_df['Aroon Up Trend'] = (result_df['Aroon Up'].values >= 70).astype(int)
     result_df['Aroon Down Trend'] = (result_df['Aroon Down'].values >= 70).astype(int)
 
@@ -39,10 +40,10 @@ def calculate_aroon(prepared_data):
 
 def calculate_average_directional_index(prepared_data):
     result = indicators.get_adx(prepared_data)
-    result_df = pd.DataFrame({
-        'Date': [val.date for val in result],
-        'Plus Directional Index': [val.pdi for val in result],  
-        'Minus Directional Index': [val.mdi for val in result]
+    result_df = _results_to_dataframe(result, {
+        'Date': 'date',
+        'Plus Directional Index': 'pdi',
+        'Minus Directional Index': 'mdi'
     })
 
     result_df.dropna(subset=['Plus Directional Index', 'Minus Directional Index'], inplace=True)
@@ -55,22 +56,41 @@ def calculate_average_directional_index(prepared_data):
 
     return result_df.set_index('Date')
 
+def _count_previous_days(condition, rolling_window, minimum_count):
+    """
+    (Internal Helper) Flag the rows where the condition held on at least minimum_count of the previous rolling_window rows
+
+    Args:
+        condition (np.array): A boolean array of the condition for every row
+        rolling_window (int): The number of previous rows to look at
+        minimum_count (int): The minimum number of previous rows meeting the condition
+
+    Returns:
+        np.array: 1.0 where the condition held often enough, 0.0 where it did not and NaN for the first rolling_window rows
+    """
+    flags = np.full(len(condition), np.nan)
+    if len(condition) > rolling_window:
+        counts = sliding_window_view(condition, rolling_window)[:-1].sum(axis=1)
+        flags[rolling_window:] = counts >= minimum_count
+
+    return flags
+
 def calculate_elder_ray_index(prepared_data):
     result = indicators.get_elder_ray(prepared_data)
 
-    result_df = pd.DataFrame({
-        'Date': [val.date for val in result],
-        'Bull Power': [val.bull_power for val in result],
-        'Bear Power': [val.bear_power for val in result]
+    result_df = _results_to_dataframe(result, {
+        'Date': 'date',
+        'Bull Power': 'bull_power',
+        'Bear Power': 'bear_power'
     })
 
     result_df.dropna(subset=['Bull Power', 'Bear Power'], inplace=True)
 
     result_df['Bull Power Up Trend'] = identify_historical_trends(result_df, 'Bull Power', 10, make_bool_up=True)
-    result_df['Bull Power 80% Positives'] = np.array([np.nan if i < 10 else np.sum(result_df['Bull Power'].values[i-10:i] > 0) >= 8 for i in range(len(result_df))])
+    result_df['Bull Power 80% Positives'] = _count_previous_days(result_df['Bull Power'].values > 0, 10, 8)
 
     result_df['Bear Power Trend'] = identify_historical_trends(result_df, 'Bear Power', 10, make_bool_down=True)
-    result_df['Bear Power 80% Negatives'] = np.array([np.nan if i < 10 else np.sum(result_df['Bear Power'].values[i-10:i] < 0) >= 8 for i in range(len(result_df))])
+    result_df['Bear Power 80% Negatives'] = _count_previous_days(result_df['Bear Power'].values < 0, 10, 8)
 
     result_df.drop(columns=['Bull Power', 'Bear Power'], inplace=True)
 
@@ -78,10 +98,9 @@ def calculate_elder_ray_index(prepared_data):
 
 def calculate_moving_average_convergence_divergence(prepared_data):
     result = indicators.get_macd(prepared_data)
-    result_df = pd.DataFrame({
-        'Date': [val.date for val in result],
-        'Histogram MACD': [val.histogram for val in result]
-        
+    result_df = _results_to_dataframe(result, {
+        'Date': 'date',
+        'Histogram MACD': 'histogram'
     })
 
     result_df.dropna(subset=['Histogram MACD'], inplace=True)
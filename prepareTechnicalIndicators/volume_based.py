@@ -2,79 +2,79 @@ import numpy as np
 import pandas as pd
 from stock_indicators import indicators
 
-from prepareTechnicalIndicators.helper import identify_historical_trends
+from prepareTechnicalIndicators.helper import identify_historical_trend_directions, _results_to_dataframe
 
 def calculate_on_balance_volume(prepared_data):
     result = indicators.get_obv(prepared_data, 10)
-    result_df = pd.DataFrame({
-        'Date': [val.date for val in result],
-        'On Balance Volume': [val.obv for val in result],
+    result_df = _results_to_dataframe(result, {
+        'Date': 'date',
+        'On Balance Volume': 'obv'
     })
 
-    result_df.dropna(subset=['On Balance Volume'], inplace=True)
+    result_df = result_df.dropna(subset=['On Balance Volume'])
 
-    result_df['On Balance Volume Increasing'] = identify_historical_trends(result_df, 'On Balance Volume', 5, make_bool_up=True)
-    result_df['On Balance Volume Decreasing'] = identify_historical_trends(result_df, 'On Balance Volume', 5, make_bool_down=True)
+    obv_increasing, obv_decreasing = identify_historical_trend_directions(result_df, 'On Balance Volume', 5)
 
     obv_ma20 = result_df['On Balance Volume'].rolling(window=20).mean()
-    result_df['OBV to MA20 Ratio'] = result_df['On Balance Volume'] / obv_ma20.replace(0, np.nan)
-    result_df['OBV to MA20 Ratio'] = result_df['OBV to MA20 Ratio'].replace([np.inf, -np.inf], np.nan)
+    obv_to_ma20_ratio = (result_df['On Balance Volume'] / obv_ma20.replace(0, np.nan)).replace([np.inf, -np.inf], np.nan)
 
-    result_df.drop(columns=['On Balance Volume'], inplace=True)
-
-    return result_df.set_index('Date')
+    return pd.DataFrame({
+        'On Balance Volume Increasing': obv_increasing,
+        'On Balance Volume Decreasing': obv_decreasing,
+        'OBV to MA20 Ratio': obv_to_ma20_ratio.values
+    }, index=pd.Index(result_df['Date'], name='Date'))
 
 def calculate_accumulation_distribution_line(prepared_data):
     result = indicators.get_adl(prepared_data, 10)
-    result_df = pd.DataFrame({
-        'Date': [val.date for val in result],
-        'Accumulation Distribution Line': np.array([val.adl for val in result]).astype(float),
+    result_df = _results_to_dataframe(result, {
+        'Date': 'date',
+        'Accumulation Distribution Line': 'adl'
     })
+    result_df = result_df.astype({'Accumulation Distribution Line': float})
 
-    result_df.dropna(subset=['Accumulation Distribution Line'], inplace=True)
-
-    result_df['Accumulation Distribution Line Increasing'] = identify_historical_trends(result_df, 'Accumulation Distribution Line', 5, make_bool_up=True)
-    result_df['Accumulation Distribution Line Decreasing'] = identify_historical_trends(result_df, 'Accumulation Distribution Line', 5, make_bool_down=True)
+    result_df = result_df.dropna(subset=['Accumulation Distribution Line'])
 
-    result_df.drop(columns=['Accumulation Distribution Line'], inplace=True)
+    adl_increasing, adl_decreasing = identify_historical_trend_directions(result_df, 'Accumulation Distribution Line', 5)
 
-    return result_df.set_index('Date')
+    return pd.DataFrame({
+        'Accumulation Distribution Line Increasing': adl_increasing,
+        'Accumulation Distribution Line Decreasing': adl_decreasing
+    }, index=pd.Index(result_df['Date'], name='Date'))
 
 def calculate_chaikin_money_flow(prepared_data):
     result = indicators.get_cmf(prepared_data)
-    result_df = pd.DataFrame({
-        'Date': [val.date for val in result],
-        'Chaikin Money Flow': [val.cmf for val in result]
+    result_df = _results_to_dataframe(result, {
+        'Date': 'date',
+        'Chaikin Money Flow': 'cmf'
     })
 
-    result_df.dropna(subset=['Chaikin Money Flow'], inplace=True)
-
-    result_df['Positive CMF'] = (result_df['Chaikin Money Flow'] > 0).astype(int)
-    result_df['Strong Positive CMF'] = (result_df['Chaikin Money Flow'] >= 0.25).astype(int)
-    result_df['Negative CMF'] = (result_df['Chaikin Money Flow'] <= 0).astype(int)
-    result_df['Strong Negative CMF'] = (result_df['Chaikin Money Flow'] <= -0.25).astype(int)
-    result_df['Crossover CMF'] = [np.nan] + ((result_df['Chaikin Money Flow'].values[:-1] * result_df['Chaikin Money Flow'].values[1:]) <= 0).astype(int).tolist()
+    result_df = result_df.dropna(subset=['Chaikin Money Flow'])
+    cmf = result_df['Chaikin Money Flow'].values
 
-    result_df.drop(columns=['Chaikin Money Flow'], inplace=True)
-
-    return result_df.set_index('Date')
+    return pd.DataFrame({
+        'Positive CMF': (cmf > 0).astype(np.int8),
+        'Strong Positive CMF': (cmf >= 0.25).astype(np.int8),
+        'Negative CMF': (cmf <= 0).astype(np.int8),
+        'Strong Negative CMF': (cmf <= -0.25).astype(np.int8),
+        'Crossover CMF': np.concatenate(([np.nan], ((cmf[:-1] * cmf[1:]) <= 0).astype(float)))
+    }, index=pd.Index(result_df['Date'], name='Date'))
 
 def calculate_money_flow_index(prepared_data):
     result = indicators.get_mfi(prepared_data)
-    result_df = pd.DataFrame({
-        'Date': [val.date for val in result],
-        'Money Flow Index': [val.mfi for val in result]
+    result_df = _results_to_dataframe(result, {
+        'Date': 'date',
+        'Money Flow Index': 'mfi'
     })
 
-    result_df.dropna(subset=['Money Flow Index'], inplace=True)
-    
-    result_df['MFI Value'] = result_df['Money Flow Index']
-
-    result_df['MFI Overbought'] = (result_df['Money Flow Index'] >= 80).astype(int)
-    result_df['MFI Oversold'] = (result_df['Money Flow Index'] <= 20).astype(int)
-    result_df['MFI Increasing'] = identify_historical_trends(result_df, 'Money Flow Index', 5, make_bool_up=True)
-    result_df['MFI Decreasing'] = identify_historical_trends(result_df, 'Money Flow Index', 5, make_bool_down=True)
+    result_df = result_df.dropna(subset=['Money Flow Index'])
+    mfi = result_df['Money Flow Index'].values
 
-    result_df.drop(columns=['Money Flow Index'], inplace=True)
+    mfi_increasing, mfi_decreasing = identify_historical_trend_directions(result_df, 'Money Flow Index', 5)
 
-    return result_df.set_index('Date')
\ No newline at end of file
+    return pd.DataFrame({
+        'MFI Value': mfi,
+        'MFI Overbought': (mfi >= 80).astype(np.int8),
+        'MFI Oversold': (mfi <= 20).astype(np.int8),
+        'MFI Increasing': mfi_increasing,
+        'MFI Decreasing': mfi_decreasing
+    }, index=pd.Index(result_df['Date'], name='Date'))
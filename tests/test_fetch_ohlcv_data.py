@@ -0,0 +1,37 @@
+import pytest
+from multiprocessing.pool import ThreadPool
+
+pytest.importorskip("yfinance")
+
+from fetchOHLCVData import helper
+
+TICKERS = ["BBCA.JK", "BBRI.JK", "BMRI.JK", "TLKM.JK"]
+
+@pytest.fixture(autouse=True)
+def empty_caches(monkeypatch):
+    monkeypatch.setattr(helper, "_SESSIONS", {})
+    monkeypatch.setattr(helper, "_TICKERS", {})
+
+def test_threads_share_one_session():
+    with ThreadPool(processes=8) as pool:
+        sessions = pool.map(lambda _: helper._get_session(), range(32))
+
+    assert all(session is helper._get_session() for session in sessions)
+
+def test_threads_share_one_ticker_per_symbol():
+    with ThreadPool(processes=8) as pool:
+        tickers = pool.map(helper._get_ticker, TICKERS * 8)
+
+    for symbol, ticker in zip(TICKERS * 8, tickers):
+        assert ticker is helper._get_ticker(symbol)
+
+    assert len({id(ticker) for ticker in tickers}) == len(TICKERS)
+
+def test_new_process_gets_new_session_and_ticker(monkeypatch):
+    parent_session = helper._get_session()
+    parent_ticker = helper._get_ticker(TICKERS[0])
+
+    monkeypatch.setattr(helper.os, "getpid", lambda: -1)
+
+    assert helper._get_session() is not parent_session
+    assert helper._get_ticker(TICKERS[0]) is not parent_ticker
@@ -1,34 +1,96 @@
 import shutil
-import pickle
+import joblib
 import numpy as np
 import pandas as pd
 from pathlib import Path
 from camel_converter import to_camel
+from utils.io import read_csv_parquet_cached, read_csv_cached
 from utils.pipeline import get_label_config
 
-def _ensure_directories_exist(model_version: int, label_types: list) -> None:
+def _ensure_directories_exist(model_version: int, label_types: list, clear_existing: bool = True) -> None:
     """
     (Internal Helper) Ensure all required directories exist before training.
 
     Args:
     model_version (int): The version of model currently being developed
     label_types (list): A list containing all the types of label
+    clear_existing (bool): If True, previously developed models and performances are removed
     """
     for label_type in label_types:
         camel_label = to_camel(label_type)
         model_pkl_folder_path = Path(f"data/stock/model_v{model_version}/{camel_label}")
         model_performance_folder_path = Path(f"data/stock/model_v{model_version}/performance/{camel_label}")
 
-        if model_pkl_folder_path.exists():
+        if clear_existing and model_pkl_folder_path.exists():
             shutil.rmtree(model_pkl_folder_path)
         model_pkl_folder_path.mkdir(parents=True, exist_ok=True)
         
-        if model_performance_folder_path.exists():
+        if clear_existing and model_performance_folder_path.exists():
             shutil.rmtree(model_performance_folder_path)
         model_performance_folder_path.mkdir(parents=True, exist_ok=True)
     
     return
 
+def _get_model_path(model_version: int, label_type: str, identifier: str, window: int) -> Path:
+    """
+    (Internal Helper) Get the file path of a developed model
+
+    Args:
+    model_version (int): The version of machine learning model being developed
+    label_type (str): The label used for developing the model
+    identifier (str): An identifier for saving the model, could be ticker or industry
+    window (int): The window used for generating the label
+
+    Returns:
+    Path: The path where the model is saved
+    """
+    camel_label = to_camel(label_type)
+    return Path(f"data/stock/model_v{model_version}/{camel_label}/{identifier}-{window}dd.pkl")
+
+def _get_performance_path(model_version: int, label_type: str, window: int) -> Path:
+    """
+    (Internal Helper) Get the file path of the performance metrics of every model sharing a label type and window
+
+    Args:
+    model_version (int): The version of machine learning model being developed
+    label_type (str): The label used for developing the model
+    window (int): The window used for generating the label
+
+    Returns:
+    Path: The path where the performance metrics are saved
+    """
+    camel_label = to_camel(label_type)
+    return Path(f"data/stock/model_v{model_version}/performance/{camel_label}/{window}dd.csv")
+
+def _get_identifiers_with_metrics(model_version: int, label_type: str, window: int) -> set:
+    """
+    (Internal Helper) Get the identifiers whose performance metrics have already been saved
+
+    The performance file holds one row per ticker, so the rows are mapped back to the identifiers of the model version:
+    the ticker itself for v1, the industry of the ticker for v2, and IHSG for v3 and v4.
+
+    Args:
+    model_version (int): The version of machine learning model being developed
+    label_type (str): The label used for developing the model
+    window (int): The window used for generating the label
+
+    Returns:
+    set: The identifiers that have a saved performance row
+    """
+    try:
+        saved_tickers = set(pd.read_csv(_get_performance_path(model_version, label_type, window), usecols=["Ticker"])["Ticker"])
+    except FileNotFoundError:
+        return set()
+
+    if model_version == 1:
+        return saved_tickers
+
+    elif model_version == 2:
+        ticker_industry_df = read_csv_cached('data/selected_ticker_and_industry_list.csv')
+        return set(ticker_industry_df.loc[ticker_industry_df['Ticker'].isin(saved_tickers), 'Industry'])
+
+    return {'IHSG'} if saved_tickers else set()
+
 def _save_model(model: any, model_version: int, label_type: str, identifier: str, window: int) -> None:
     """
     (Internal Helper) Save a trained model to file
@@ -40,10 +102,9 @@ def _save_model(model: any, model_version: int, label_type: str, identifier: str
     identifier (str): An identifier for saving the model, could be ticker or industry
     window (int): The window used for generating the label
     """
-    camel_label = to_camel(label_type)
-    filepath = Path(f"data/stock/model_v{model_version}/{camel_label}/{identifier}-{window}dd.pkl")
-    with open(filepath, "wb") as f:
-        pickle.dump(model, f)
+    filepath = _get_model_path(model_version, label_type, identifier, window)
+    # Stored uncompressed so the numpy arrays inside the model can be memory-mapped at forecast time
+    joblib.dump(model, filepath, compress=0, protocol=5)
     
     return
 
@@ -61,32 +122,20 @@ def _combine_metrics(ticker: str, model_version: int, train_metrics: pd.DataFram
     Returns:
     pd.DataFrame: A pandas dataframe containing all the training and testing metrics of the model
     """
-    train_df = pd.DataFrame(train_metrics)
-    train_df.columns = [f"Train - {col}" for col in train_df.columns]
-
-    test_df = pd.DataFrame(test_metrics)
-    test_df.columns = [f"Test - {col}" for col in test_df.columns]
-
-    result = pd.concat([train_df, test_df], axis=1)
+    result = {f"Train - {col}": values for col, values in train_metrics.items()}
+    result.update({f"Test - {col}": values for col, values in test_metrics.items()})
 
     if model_version == 1:
-        result.insert(0, "Ticker", ticker)
-
-        threshold_value = pd.read_csv(Path(f'data/stock/label/{ticker}.csv'))[threshold_col].iloc[0]
-        result["Threshold"] = threshold_value
+        threshold_value = read_csv_parquet_cached(Path(f'data/stock/label/{ticker}.csv'), usecols=[threshold_col])[threshold_col].iloc[0]
+        result = {"Ticker": ticker, **result, "Threshold": threshold_value}
 
     elif model_version in [2, 3, 4]:
-        Ticker_column = [col for col in result.columns if 'Ticker' in col]
-        threshold_column = [col for col in result.columns if 'Threshold' in col]
-
-        assert len(Ticker_column) == 2
-        assert len(threshold_column) == 2
+        train_ticker, test_ticker = np.asarray(result.pop("Train - Ticker")), np.asarray(result.pop("Test - Ticker"))
+        train_threshold, test_threshold = np.asarray(result.pop("Train - Threshold")), np.asarray(result.pop("Test - Threshold"))
 
-        assert np.all(result[Ticker_column[0]].values == result[Ticker_column[1]].values, axis=0)
-        assert np.all(result[threshold_column[0]].values == result[threshold_column[1]].values, axis=0)
+        assert np.all(train_ticker == test_ticker, axis=0)
+        assert np.all(train_threshold == test_threshold, axis=0)
 
-        result.insert(0, "Ticker", result[Ticker_column[0]].values)
-        result["Threshold"] = result[threshold_column[0]].values
-        result.drop(columns=Ticker_column + threshold_column, inplace=True)
+        result = {"Ticker": train_ticker, **result, "Threshold": train_threshold}
     
-    return result
\ No newline at end of file
+    return pd.DataFrame(result)
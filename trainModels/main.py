@@ -1,7 +1,8 @@
 import numpy as np
-import pandas as pd
 from pathlib import Path
+from threadpoolctl import threadpool_limits
 from skopt.space import Real, Integer
+from utils.io import read_csv_parquet_cached
 from utils.pipeline import get_label_config
 
 from trainModels.modelling import (
@@ -24,6 +25,18 @@ from trainModels.helper import _save_model, _combine_metrics
 from prepareTechnicalIndicators.helper import get_all_technical_indicators
 from combineForecasts.helper import _get_combined_forecasts_features_target_threshold
 
+_THREAD_COUNT = -1
+
+def _init_worker(thread_count: int = -1) -> None:
+    """
+    (Internal Helper) Set the number of threads the worker's models may use
+
+    Args:
+        thread_count (int): The number of threads each model may use, -1 for every core
+    """
+    global _THREAD_COUNT
+    _THREAD_COUNT = thread_count
+
 def develop_model_v1(ticker: str, target_column: str, positive_label: str, negative_label: str) -> (any, dict, dict):
     """
     Main orchestration function for the entire model development process
@@ -46,7 +59,7 @@ def develop_model_v1(ticker: str, target_column: str, positive_label: str, negat
 
     feature_columns = get_all_technical_indicators()
 
-    prepared_data = pd.read_csv(Path(f'data/stock/label/{ticker}.csv'))
+    prepared_data = read_csv_parquet_cached(Path(f'data/stock/label/{ticker}.csv'), usecols=['Date'] + feature_columns + [target_column])
 
     cleaned_data = prepared_data.dropna(subset=[target_column])
 
@@ -63,7 +76,7 @@ def develop_model_v1(ticker: str, target_column: str, positive_label: str, negat
     all_test_metrics = []
     
     for _ in range(10):
-        model = _initializes_fit_tune_catboost_with_bayesian_optimization(train_feature, train_target, cv_split, search_spaces)
+        model = _initializes_fit_tune_catboost_with_bayesian_optimization(train_feature, train_target, cv_split, search_spaces, _THREAD_COUNT)
 
         test_metrics = _measure_model_performance(model, test_feature, test_target, positive_label, negative_label)
 
@@ -104,7 +117,7 @@ def develop_model_v2(industry: str, target_column: str, positive_label: str, neg
     """
     feature_columns = get_all_technical_indicators()
 
-    prepared_data = _combine_multiple_ticker_in_industry(industry)
+    prepared_data = _combine_multiple_ticker_in_industry(industry, usecols=['Date'] + feature_columns + [target_column])
 
     cleaned_data = prepared_data.dropna(subset=[target_column])
 
@@ -121,7 +134,7 @@ def develop_model_v2(industry: str, target_column: str, positive_label: str, neg
     all_test_metrics = []
     
     for _ in range(10):
-        model = _initializes_fit_tune_catboost_with_bayesian_optimization(train_feature, train_target, cv_split, search_spaces)
+        model = _initializes_fit_tune_catboost_with_bayesian_optimization(train_feature, train_target, cv_split, search_spaces, _THREAD_COUNT)
 
         _, test_metrics = _measure_model_performance_for_all_ticker_in_industry(industry, model, target_column, positive_label, negative_label, threshold_col)
 
@@ -160,7 +173,7 @@ def develop_model_v3(target_column: str, positive_label: str, negative_label: st
     """
     feature_columns = get_all_technical_indicators()
 
-    prepared_data = _combine_multiple_ticker('data/stock/label')
+    prepared_data = _combine_multiple_ticker('data/stock/label', usecols=['Date'] + feature_columns + [target_column])
 
     cleaned_data = prepared_data.dropna(subset=[target_column])
     
@@ -177,7 +190,7 @@ def develop_model_v3(target_column: str, positive_label: str, negative_label: st
     all_test_metrics = []
     
     for _ in range(10):
-        model = _initializes_fit_tune_catboost_with_bayesian_optimization(train_feature, train_target, cv_split, search_spaces)
+        model = _initializes_fit_tune_catboost_with_bayesian_optimization(train_feature, train_target, cv_split, search_spaces, _THREAD_COUNT)
 
         _, test_metrics = _measure_model_performance_for_all_ticker(model, target_column, positive_label, negative_label, threshold_col)
 
@@ -216,7 +229,7 @@ def develop_model_v4(rolling_window: int, positive_label: str, negative_label: s
     """
     feature_columns, target_column, threshold_column = _get_combined_forecasts_features_target_threshold(rolling_window)
 
-    prepared_data = _combine_multiple_ticker(f'data/stock/combined_forecasts_{rolling_window}dd')
+    prepared_data = _combine_multiple_ticker(f'data/stock/combined_forecasts_{rolling_window}dd', usecols=['Date'] + feature_columns + [target_column])
     
     cleaned_data = prepared_data.dropna(subset=[target_column])
 
@@ -226,7 +239,7 @@ def develop_model_v4(rolling_window: int, positive_label: str, negative_label: s
     all_test_metrics = []
     
     for _ in range(10):
-        model = _initializes_fit_tune_logistic_regression_with_bayesian_optimization(train_feature, train_target, cv_split)
+        model = _initializes_fit_tune_logistic_regression_with_bayesian_optimization(train_feature, train_target, cv_split, _THREAD_COUNT)
 
         _, test_metrics = _measure_model_performance_on_forecast_features_for_all_ticker(model, rolling_window, positive_label, negative_label)
 
@@ -257,33 +270,32 @@ def process_single_model(args_tuple):
     """
     identifier, label_type, rolling_window, model_version = args_tuple
  
-    target_col, threshold_col, pos_label, neg_label = get_label_config(
-            label_type, rolling_window
-        )
+    target_col, threshold_col, pos_label, neg_label = get_label_config(label_type, rolling_window)
     failed_process = []
     metrics_list = []
 
     try:
-        if model_version in [1, 2, 3]:
-            if model_version == 1:
-                model, train_metrics, test_metrics = develop_model_v1(
-                    identifier, target_col, pos_label, neg_label
-                )
-
-            elif model_version == 2:
-                model, train_metrics, test_metrics = develop_model_v2(
-                    identifier, target_col, pos_label, neg_label, threshold_col
-                )
-            
-            elif model_version == 3:
-                model, train_metrics, test_metrics = develop_model_v3(
-                    target_col, pos_label, neg_label, threshold_col
-                )
-                        
-        elif model_version == 4:
-            model, train_metrics, test_metrics, threshold_col = develop_model_v4(
-                            rolling_window, pos_label, neg_label
-                        )
+        with threadpool_limits(1):
+            if model_version in [1, 2, 3]:
+                if model_version == 1:
+                    model, train_metrics, test_metrics = develop_model_v1(
+                        identifier, target_col, pos_label, neg_label
+                    )
+
+                elif model_version == 2:
+                    model, train_metrics, test_metrics = develop_model_v2(
+                        identifier, target_col, pos_label, neg_label, threshold_col
+                    )
+                
+                elif model_version == 3:
+                    model, train_metrics, test_metrics = develop_model_v3(
+                        target_col, pos_label, neg_label, threshold_col
+                    )
+                            
+            elif model_version == 4:
+                model, train_metrics, test_metrics, threshold_col = develop_model_v4(
+                                rolling_window, pos_label, neg_label
+                            )
 
         _save_model(model, model_version, label_type, identifier, rolling_window)
         
@@ -296,4 +308,24 @@ def process_single_model(args_tuple):
     except Exception as e:
         failed_process.append((identifier, label_type, rolling_window, str(e)))
 
-    return failed_process, metrics_list
\ No newline at end of file
+    return failed_process, metrics_list
+
+def process_model_batch(args_batch):
+    """
+    Utilize label data to create several machine learning models within a single worker task.
+
+    Args:
+        args_batch: List of tuples, each containing (identifier, label_type, rolling_window, model_version)
+
+    Returns:
+        Tuple of (failed_process, metrics_list) gathered from every model in the batch
+    """
+    failed_process = []
+    metrics_list = []
+
+    for args_tuple in args_batch:
+        single_failed_process, single_metrics_list = process_single_model(args_tuple)
+        failed_process.extend(single_failed_process)
+        metrics_list.extend(single_metrics_list)
+
+    return failed_process, metrics_list
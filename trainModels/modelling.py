@@ -9,55 +9,71 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import RobustScaler
 from sklearn.model_selection import PredefinedSplit
-from sklearn.metrics import accuracy_score, precision_score, recall_score, roc_auc_score
+from sklearn.metrics import accuracy_score, precision_recall_fscore_support, roc_auc_score
 
 from prepareTechnicalIndicators.helper import get_all_technical_indicators
 from combineForecasts.helper import _get_combined_forecasts_features_target_threshold
+from utils.io import read_csv_parquet_cached, read_csv_cached
 from utils.pipeline import get_split_dates, get_split_masks
 
 
-def _combine_multiple_ticker_in_industry(industry: str) -> pd.DataFrame:
+def _downcast_float_columns(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    (Internal Helper) Downcast the float64 columns of a dataframe to float32, halving the memory of the combined training data
+
+    Args:
+        data (pd.DataFrame): A pandas dataframe read from a ticker's data
+
+    Returns:
+        pd.DataFrame: The same data with every float64 column stored as float32
+    """
+    float_columns = data.select_dtypes(include="float64").columns
+    return data.astype({col: np.float32 for col in float_columns}, copy=False)
+
+def _combine_multiple_ticker_in_industry(industry: str, usecols: list = None) -> pd.DataFrame:
     """
     (Internal Helper) Combine all ticker in an industry will be used as training data
 
     Args:
         industry (str): The name of the industry in which the ticker will be selected
+        usecols (list): The columns to read from each ticker's data (None to read all columns)
 
     Returns:
         pd.DataFrame: A pandas dataframe containing all the ticker in an industry
     """
-    ticker_industry_df = pd.read_csv(Path('data/selected_ticker_and_industry_list.csv'))
+    ticker_industry_df = read_csv_cached('data/selected_ticker_and_industry_list.csv')
     
     selected_ticker_industry_df = ticker_industry_df[ticker_industry_df['Industry'] == industry]
     
     selected_ticker = selected_ticker_industry_df['Ticker'].values
     
-    selected_ticker_df = pd.concat((pd.read_csv(f'data/stock/label/{ticker}.csv')) for ticker in selected_ticker) \
+    selected_ticker_df = pd.concat(_downcast_float_columns(read_csv_parquet_cached(f'data/stock/label/{ticker}.csv', usecols=usecols)) for ticker in selected_ticker) \
                             .sort_values('Date', ascending=True) \
                             .reset_index(drop=True)
 
     return selected_ticker_df
 
-def _combine_multiple_ticker(csv_folder_path: str) -> pd.DataFrame:
+def _combine_multiple_ticker(csv_folder_path: str, usecols: list = None) -> pd.DataFrame:
     """
     (Internal Helper) Combine data from multiple ticker into a single pandas dataframe
 
     Args:
         csv_folder_path (str): The path to the folder containing the data
+        usecols (list): The columns to read from each ticker's data (None to read all columns)
 
     Returns:
         pd.DataFrame: A pandas dataframe containing all the selected ticker
     """
     all_ticker_path = Path(csv_folder_path).rglob("*.csv")
     
-    selected_ticker_df = pd.concat((pd.read_csv(ticker_path) for ticker_path in all_ticker_path)) \
+    selected_ticker_df = pd.concat(_downcast_float_columns(read_csv_parquet_cached(ticker_path, usecols=usecols)) for ticker_path in all_ticker_path) \
                             .sort_values('Date', ascending=True) \
                             .reset_index(drop=True)
 
 
     return selected_ticker_df
 
-def _split_data_to_train_val_test_single(data: pd.DataFrame, feature_columns: list, target_column: str) -> (pd.DataFrame, pd.Series, pd.DataFrame, pd.Series, PredefinedSplit):
+def _split_data_to_train_val_test_single(data: pd.DataFrame, feature_columns: list, target_column: str) -> (np.array, np.array, np.array, np.array, PredefinedSplit):
     """
     (Internal Helper) Splits time-series data into training, validation, and testing sets
 
@@ -73,23 +89,23 @@ def _split_data_to_train_val_test_single(data: pd.DataFrame, feature_columns: li
 
     Returns:
         tuple: A tuple containing:
-               - train_feature (pd.DataFrame): Features for the training set
-               - train_target (pd.Series): Target for the training set
-               - test_feature (pd.DataFrame): Features for the test set
-               - test_target (pd.Series): Target for the test set
+               - train_feature (np.array): Row-major float32 features for the training set
+               - train_target (np.array): Target for the training set
+               - test_feature (np.array): Row-major float32 features for the test set
+               - test_target (np.array): Target for the test set
                - predefined_split_index (PredefinedSplit): An index for cross-validation
                  that designates the last 40 days of the training data as the validation set
     """
     splits = get_split_dates(target_column)
     train_val_mask, train_mask, val_mask, test_mask, _ = get_split_masks(data, splits)
 
-    train_data = data[train_val_mask].copy()
-    test_data = data[test_mask].copy()
+    train_data = data[train_val_mask]
+    test_data = data[test_mask]
 
-    train_feature = train_data[feature_columns]
-    train_target = train_data[target_column]
-    test_feature = test_data[feature_columns]
-    test_target = test_data[target_column]
+    train_feature = np.ascontiguousarray(train_data[feature_columns].to_numpy(dtype=np.float32))
+    train_target = train_data[target_column].to_numpy()
+    test_feature = np.ascontiguousarray(test_data[feature_columns].to_numpy(dtype=np.float32))
+    test_target = test_data[target_column].to_numpy()
     
     val_mask_train = val_mask[train_val_mask]
     
@@ -99,7 +115,7 @@ def _split_data_to_train_val_test_single(data: pd.DataFrame, feature_columns: li
     
     return train_feature, train_target, test_feature, test_target, predefined_split_index
 
-def _split_data_to_train_val_test_multiple(data: pd.DataFrame, feature_columns: list, target_column: str) -> (pd.DataFrame, pd.Series, pd.DataFrame, pd.Series, PredefinedSplit):
+def _split_data_to_train_val_test_multiple(data: pd.DataFrame, feature_columns: list, target_column: str) -> (np.array, np.array, np.array, np.array, PredefinedSplit):
     """
     (Internal Helper) Splits time-series data into training, validation, and testing sets
 
@@ -115,10 +131,10 @@ def _split_data_to_train_val_test_multiple(data: pd.DataFrame, feature_columns:
 
     Returns:
         tuple: A tuple containing:
-               - train_feature (pd.DataFrame): Features for the training set
-               - train_target (pd.Series): Target for the training set
-               - test_feature (pd.DataFrame): Features for the test set
-               - test_target (pd.Series): Target for the test set
+               - train_feature (np.array): Row-major float32 features for the training set
+               - train_target (np.array): Target for the training set
+               - test_feature (np.array): Row-major float32 features for the test set
+               - test_target (np.array): Target for the test set
                - predefined_split_index (PredefinedSplit): An index for cross-validation
                  that designates the last 40 days of the training data as the validation set
     """
@@ -126,13 +142,13 @@ def _split_data_to_train_val_test_multiple(data: pd.DataFrame, feature_columns:
     splits = get_split_dates(target_column)
     train_val_mask, train_mask, val_mask, test_mask, _ = get_split_masks(data, splits)
 
-    train_data = data[train_val_mask].copy()
-    test_data = data[test_mask].copy()
+    train_data = data[train_val_mask]
+    test_data = data[test_mask]
     
-    train_feature = train_data[feature_columns]
-    train_target = train_data[target_column]
-    test_feature = test_data[feature_columns]
-    test_target = test_data[target_column]
+    train_feature = np.ascontiguousarray(train_data[feature_columns].to_numpy(dtype=np.float32))
+    train_target = train_data[target_column].to_numpy()
+    test_feature = np.ascontiguousarray(test_data[feature_columns].to_numpy(dtype=np.float32))
+    test_target = test_data[target_column].to_numpy()
     
     val_mask_train = val_mask[train_val_mask]
     
@@ -142,7 +158,7 @@ def _split_data_to_train_val_test_multiple(data: pd.DataFrame, feature_columns:
     
     return train_feature, train_target, test_feature, test_target, predefined_split_index
 
-def _initializes_fit_tune_catboost_with_bayesian_optimization(train_feature: np.array, train_target: np.array, predefined_split_index: PredefinedSplit, search_spaces: dict) -> any:
+def _initializes_fit_tune_catboost_with_bayesian_optimization(train_feature: np.array, train_target: np.array, predefined_split_index: PredefinedSplit, search_spaces: dict, thread_count: int = -1) -> any:
     """
     (Internal Helper) Initializes, fits, and tunes a CatBoost Classifier using Bayesian Optimization
 
@@ -156,6 +172,7 @@ def _initializes_fit_tune_catboost_with_bayesian_optimization(train_feature: np.
         train_target (np.array): The target variable for training
         predefined_split_index (PredefinedSplit): The cross-validation strategy
         search_spaces (dict): A dictionary containing hyperparameters to be tuned
+        thread_count (int): The number of threads CatBoost may use, -1 for every core
 
     Returns:
         CatBoostClassifier: The best-performing model found by the search
@@ -175,7 +192,7 @@ def _initializes_fit_tune_catboost_with_bayesian_optimization(train_feature: np.
         loss_function='Logloss',
         eval_metric='AUC',
         logging_level='Silent',
-        thread_count=-1,
+        thread_count=thread_count,
     )
 
     hyper_tune_search = BayesSearchCV(
@@ -202,7 +219,7 @@ def _initializes_fit_tune_catboost_with_bayesian_optimization(train_feature: np.
 
     return best_model
 
-def _initializes_fit_tune_logistic_regression_with_bayesian_optimization(train_feature: np.array, train_target: np.array, predefined_split_index: PredefinedSplit) -> any:
+def _initializes_fit_tune_logistic_regression_with_bayesian_optimization(train_feature: np.array, train_target: np.array, predefined_split_index: PredefinedSplit, n_jobs: int = -1) -> any:
     """
     (Internal Helper) Initializes, fits, and tunes a Logistic Regression model using Bayesian Optimization.
 
@@ -215,6 +232,7 @@ def _initializes_fit_tune_logistic_regression_with_bayesian_optimization(train_f
         train_feature (np.array): The feature set for training
         train_target (np.array): The target variable for training
         predefined_split_index (PredefinedSplit): The cross-validation strategy
+        n_jobs (int): The number of parallel jobs used by the search, -1 for every core
 
     Returns:
         LogisticRegression: The best-performing model found by the search
@@ -254,7 +272,7 @@ def _initializes_fit_tune_logistic_regression_with_bayesian_optimization(train_f
         n_iter=30,
         cv=predefined_split_index,
         scoring=scoring_method,
-        n_jobs=-1,
+        n_jobs=n_jobs,
         random_state=10120024,
         verbose=0
     )
@@ -352,10 +370,9 @@ def _calculate_classification_metrics(target_true: np.array, target_pred: np.arr
         tuple: A tuple containing accuracy, precision for both classes, and recall for both classes
     """
     accuracy = accuracy_score(target_true, target_pred)
-    precision_positive = precision_score(target_true, target_pred, pos_label=positive_label, zero_division=0)
-    precision_negative = precision_score(target_true, target_pred, pos_label=negative_label, zero_division=0)
-    recall_positive = recall_score(target_true, target_pred, pos_label=positive_label, zero_division=0)
-    recall_negative = recall_score(target_true, target_pred, pos_label=negative_label, zero_division=0)
+    (precision_positive, precision_negative), (recall_positive, recall_negative), _, _ = precision_recall_fscore_support(
+        target_true, target_pred, labels=[positive_label, negative_label], average=None, zero_division=0
+    )
 
     return accuracy, precision_positive, precision_negative, recall_positive, recall_negative
 
@@ -403,8 +420,8 @@ def _measure_model_performance(model: any, feature: np.array, target: np.array,
     Returns:
         dict: A dictionary containing all calculated performance metrics.
     """
-    target_pred = model.predict(feature)
     target_pred_proba = model.predict_proba(feature)
+    target_pred = np.asarray(model.classes_)[target_pred_proba.argmax(axis=1)]
 
     accuracy, prec_positive, prec_negative, rec_positive, rec_negative = _calculate_classification_metrics(target, target_pred, positive_label, negative_label)
     gini = _calculate_gini(model, target, target_pred_proba, positive_label)
@@ -462,17 +479,18 @@ def _measure_model_performance_for_all_ticker_in_industry(industry: str, model:
     Returns:
         Tuple: A tuple containing the model's performance on trainings and testing data, stored as a pandas dataframe
     """
-    ticker_industry_df = pd.read_csv(Path('data/selected_ticker_and_industry_list.csv'))
+    ticker_industry_df = read_csv_cached('data/selected_ticker_and_industry_list.csv')
     all_tickers = ticker_industry_df.loc[ticker_industry_df['Industry'] == industry, 'Ticker'].values
 
     all_ticker_train_metrics_df = pd.DataFrame()
     all_ticker_test_metrics_df = pd.DataFrame()
 
     feature_columns = get_all_technical_indicators()
+    usecols = ['Date'] + feature_columns + [target_column, threshold_col]
 
     for ticker in all_tickers:
         try:
-            prepared_data = pd.read_csv(Path(f'data/stock/label/{ticker}.csv'))
+            prepared_data = read_csv_parquet_cached(Path(f'data/stock/label/{ticker}.csv'), usecols=usecols)
             ticker_train_metrics_df, ticker_test_metrics_df = _measure_model_performance_on_single_ticker(prepared_data, model, feature_columns, target_column, positive_label, negative_label)
 
             ticker_train_metrics_df['Ticker'] = ticker
@@ -513,10 +531,11 @@ def _measure_model_performance_for_all_ticker(model: any, target_column: str, po
     all_ticker_test_metrics_df = pd.DataFrame()
 
     feature_columns = get_all_technical_indicators()
+    usecols = ['Date'] + feature_columns + [target_column, threshold_col]
 
     for ticker in all_tickers:
         try:
-            prepared_data = pd.read_csv((Path(f'data/stock/label/{ticker}.csv')))
+            prepared_data = read_csv_parquet_cached(Path(f'data/stock/label/{ticker}.csv'), usecols=usecols)
             ticker_train_metrics_df, ticker_test_metrics_df = _measure_model_performance_on_single_ticker(prepared_data, model, feature_columns, target_column, positive_label, negative_label)
     
             ticker_train_metrics_df['Ticker'] = ticker
@@ -0,0 +1,181 @@
+import io
+import os
+import pickle
+import threading
+import pandas as pd
+from pathlib import Path
+
+def read_csv_sequential(csv_file_path: str, **kwargs) -> pd.DataFrame:
+    """
+    Read a CSV file that is scanned once from start to end, advising the kernel about the access pattern.
+
+    The file is marked for sequential read-ahead before parsing and its pages are released from the
+    page cache afterwards, so many workers reading large files in parallel do not evict each other's data.
+    On platforms without posix_fadvise this behaves exactly like pd.read_csv.
+
+    Args:
+        csv_file_path (str): The path to the CSV file
+        **kwargs: Additional keyword arguments passed to pd.read_csv
+
+    Returns:
+        pd.DataFrame: The parsed CSV data
+    """
+    fd = os.open(csv_file_path, os.O_RDONLY)
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+
+        with os.fdopen(fd, "rb", closefd=False) as f:
+            data = pd.read_csv(f, **kwargs)
+
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+    return data
+
+def read_last_row(csv_file_path: str, usecols: list = None, block_size: int = 8192) -> pd.DataFrame:
+    """
+    Read only the header and the last data row of a CSV file.
+
+    Instead of parsing the whole history, the file is read backwards from its end in blocks until
+    a complete last line is found. Only the header line and that last line are handed to pd.read_csv,
+    so the cost no longer grows with the number of rows in the file.
+
+    Args:
+        csv_file_path (str): The path to the CSV file
+        usecols (list): The columns to keep, defaults to all columns
+        block_size (int): The number of bytes read from the end of the file per step
+
+    Returns:
+        pd.DataFrame: A single-row dataframe containing the last row of the CSV file (empty if the file has no data rows)
+    """
+    with open(csv_file_path, "rb") as f:
+        header = f.readline()
+        data_start = f.tell()
+
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+
+        tail = b""
+        while position > data_start:
+            read_size = min(block_size, position - data_start)
+            position -= read_size
+            f.seek(position)
+            tail = f.read(read_size) + tail
+
+            lines = tail.rstrip(b"\r\n").splitlines()
+            if len(lines) > 1 or position == data_start:
+                break
+
+    last_line = lines[-1] if tail.strip() else b""
+
+    return pd.read_csv(io.BytesIO(header + last_line), usecols=usecols)
+
+_CACHED_CSV_DATA = {}
+
+def read_csv_cached(csv_file_path: str) -> pd.DataFrame:
+    """
+    Read a small, frequently reused CSV file through a pickle cache stored next to it.
+
+    The pickle is rebuilt whenever the CSV is newer than it, so edits to the CSV are always picked up.
+    The cache is written to a temporary file and moved into place, so parallel workers and threads never read a partial pickle.
+    Within a process the parsed data is also kept in memory, so a long-lived worker only loads it once;
+    the returned dataframe is shared between callers and must be treated as read-only.
+
+    Args:
+        csv_file_path (str): The path to the CSV file
+
+    Returns:
+        pd.DataFrame: The parsed CSV data
+    """
+    csv_file_path = Path(csv_file_path)
+    pickle_file_path = csv_file_path.with_suffix(".pkl")
+
+    csv_mtime = csv_file_path.stat().st_mtime
+    cached_mtime, cached_data = _CACHED_CSV_DATA.get(csv_file_path, (None, None))
+    if cached_mtime == csv_mtime:
+        return cached_data
+
+    try:
+        if pickle_file_path.stat().st_mtime >= csv_mtime:
+            data = pd.read_pickle(pickle_file_path)
+            _CACHED_CSV_DATA[csv_file_path] = (csv_mtime, data)
+            return data
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        pass
+
+    data = pd.read_csv(csv_file_path)
+
+    temporary_file_path = pickle_file_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    data.to_pickle(temporary_file_path)
+    os.replace(temporary_file_path, pickle_file_path)
+
+    _CACHED_CSV_DATA[csv_file_path] = (csv_mtime, data)
+
+    return data
+
+def read_csv_parquet_cached(csv_file_path: str, usecols: list = None) -> pd.DataFrame:
+    """
+    Read a CSV file that is parsed many times per run through a Parquet copy stored next to it.
+
+    The first read parses the whole CSV and writes it as Parquet; later reads load only the requested
+    columns from the Parquet file. The copy is rebuilt whenever the CSV is newer than it, and it is written
+    through a temporary file, so parallel workers and threads never read a partial cache.
+
+    Args:
+        csv_file_path (str): The path to the CSV file
+        usecols (list): The columns to read, defaults to all columns
+
+    Returns:
+        pd.DataFrame: The parsed CSV data
+    """
+    csv_file_path = Path(csv_file_path)
+    parquet_file_path = csv_file_path.with_suffix(".parquet")
+
+    try:
+        if parquet_file_path.stat().st_mtime >= csv_file_path.stat().st_mtime:
+            return pd.read_parquet(parquet_file_path, columns=usecols)
+    except OSError:
+        pass
+
+    data = read_csv_sequential(csv_file_path)
+
+    temporary_file_path = parquet_file_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    data.to_parquet(temporary_file_path, index=False)
+    os.replace(temporary_file_path, parquet_file_path)
+
+    if usecols is not None:
+        data = data[usecols]
+
+    return data
+
+def write_csv_with_parquet_cache(data: pd.DataFrame, csv_file_path: str) -> None:
+    """
+    Write a dataframe as CSV together with the Parquet copy read by read_csv_parquet_cached.
+
+    The CSV stays the exported format, while readers going through read_csv_parquet_cached load the Parquet copy
+    directly instead of parsing the CSV once to build it. Integer and float columns are stored as 64-bit,
+    which is what parsing the CSV back would give. The Parquet copy is written after the CSV, so it is never
+    older than it.
+
+    Args:
+        data (pd.DataFrame): The dataframe to write
+        csv_file_path (str): The path to the CSV file
+    """
+    csv_file_path = Path(csv_file_path)
+    parquet_file_path = csv_file_path.with_suffix(".parquet")
+
+    data.to_csv(csv_file_path, index=False)
+
+    widened_dtypes = {
+        column: "int64" if pd.api.types.is_integer_dtype(dtype) else "float64"
+        for column, dtype in data.dtypes.items()
+        if (pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_float_dtype(dtype)) and not pd.api.types.is_bool_dtype(dtype)
+    }
+
+    temporary_file_path = parquet_file_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    data.astype(widened_dtypes).to_parquet(temporary_file_path, index=False)
+    os.replace(temporary_file_path, parquet_file_path)
@@ -1,7 +1,18 @@
+import sys
 import json
+import runpy
+import traceback
+import subprocess
 import pandas as pd
 from pathlib import Path
+from functools import lru_cache
 
+_LABEL_TEMPLATES = {
+    "median_gain": ("Median Gain {window}dd", "Threshold Median Gain {window}dd", "High Gain", "Low Gain"),
+    "median_loss": ("Median Loss {window}dd", "Threshold Median Loss {window}dd", "High Loss", "Low Loss"),
+}
+
+@lru_cache(maxsize=None)
 def get_label_config(label_type: str, window: int) -> tuple:
     """
     Get configuration for a specific label type and window.
@@ -16,23 +27,18 @@ def get_label_config(label_type: str, window: int) -> tuple:
     Raises:
         ValueError: If label_type is not recognized
     """
-    if label_type == "median_gain":
-        return (
-            f"Median Gain {window}dd",
-            f"Threshold Median Gain {window}dd",
-            "High Gain",
-            "Low Gain",
-        )
-    elif label_type == "median_loss":
-        return (
-            f"Median Loss {window}dd",
-            f"Threshold Median Loss {window}dd",
-            "High Loss",
-            "Low Loss",
-        )
-    else:
+    if label_type not in _LABEL_TEMPLATES:
         raise ValueError(f"Unknown label type: {label_type}")
 
+    target_template, threshold_template, positive_label, negative_label = _LABEL_TEMPLATES[label_type]
+
+    return (
+        target_template.format(window=window),
+        threshold_template.format(window=window),
+        positive_label,
+        negative_label,
+    )
+
 def get_split_dates(target_column: str) -> dict:
     """
     Get the split dates configuration based on the target column.
@@ -69,3 +75,65 @@ def get_split_masks(data: pd.DataFrame, splits: dict) -> tuple:
     forecast_mask = data['Date'] > splits['test']['end_date']
     
     return train_val_mask, train_mask, val_mask, test_mask, forecast_mask
+
+# Module-level caches filled by the pipeline steps, cleared between steps that share one interpreter so a step never
+# reads data cached from the files of an earlier step
+_STEP_CACHES = {
+    "utils.io": ("_CACHED_CSV_DATA",),
+    "utils.pipeline": ("get_label_config",),
+    "prepareTechnicalIndicators.helper": ("_load_technical_indicators",),
+    "forecastStocks.helper": ("_get_camel_label",),
+    "forecastStocks.main": ("_MODELS", "_POSITIVE_LABEL_INDEX"),
+}
+
+def _clear_step_caches() -> None:
+    """
+    (Internal Helper) Clear the module-level caches of every pipeline module imported so far
+    """
+    for module_name, cache_names in _STEP_CACHES.items():
+        module = sys.modules.get(module_name)
+        if module is None:
+            continue
+
+        for cache_name in cache_names:
+            cache = getattr(module, cache_name)
+            if hasattr(cache, "cache_clear"):
+                cache.cache_clear()
+            else:
+                cache.clear()
+
+def run_pipeline_module(module: str, module_args: list, in_process: bool = False) -> int:
+    """
+    Run a pipeline module as if it was called with python -m, and return its exit code.
+
+    By default the module runs in a separate interpreter, so a step that crashes or leaks memory cannot take the
+    caller down and no module state carries over to the next step. With in_process=True the module runs inside the
+    current interpreter through runpy, so the heavy imports (pandas, numpy, catboost, sklearn) are paid once for the
+    whole pipeline; the module-level caches are cleared after the step so the next one starts from fresh data.
+
+    Args:
+        module (str): The module to run, e.g. pipeline.train_models
+        module_args (list): The command line arguments passed to the module
+        in_process (bool): Whether to run the module inside the current interpreter
+
+    Returns:
+        int: The exit code of the module, 0 when it succeeded
+    """
+    if not in_process:
+        return subprocess.run([sys.executable, "-m", module] + module_args).returncode
+
+    original_argv = sys.argv
+    sys.argv = [module] + module_args
+    try:
+        runpy.run_module(module, run_name="__main__", alter_sys=False)
+        return 0
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+    finally:
+        sys.argv = original_argv
+        _clear_step_caches()